@@ -3,16 +3,25 @@ import os
 import sys
 import shutil
 import tkinter as tk
-from tkinter import ttk
-import requests
+from tkinter import ttk, filedialog
 import concurrent.futures
-from functools import lru_cache
+import collections
+import time
 from PIL import Image, ImageTk
-import io
 import ctypes
 from ctypes import wintypes
 import threading
 
+from leaguesheet import metrics
+from leaguesheet.autocomplete import ChampionIndex
+from leaguesheet.ddragon import DD_LOCALE, ICON_SIZES, LOCALES, DataDragon
+from leaguesheet.dragontail import import_dragontail
+from leaguesheet.engines import icon_specs, make_engine
+from leaguesheet.iconcache import decode_rgba
+from leaguesheet.liveclient import LiveClientPoller
+from leaguesheet.session import load_session, row_result, row_state, save_session, session_path
+from leaguesheet.tooltips import spell_text
+
 
 
 
@@ -204,6 +213,20 @@ def main():
  
 	def on_close():
 		unregister_global_hotkey()
+		save_snapshot()
+		# LEAGUESHEET_TRACE=<path> dumps this session's Chrome trace on exit
+		trace_path = os.getenv('LEAGUESHEET_TRACE')
+		if trace_path:
+			try:
+				metrics.METRICS.export_chrome_trace(trace_path)
+			except Exception:
+				pass
+		try:
+			live_poller.close()
+			engine.close()
+			dd.close()
+		except Exception:
+			pass
 		try:
 			root.destroy()
 		except Exception:
@@ -213,13 +236,20 @@ def main():
 	root.protocol("WM_DELETE_WINDOW", on_close)
 	apply_hotkey(hk_input_var.get())
 
+	def height_for_rows(n_rows):
+		# 1-5 rows use the hand-tuned table; past it the window grows a row at
+		# a time until most of the screen is used and the sheet scrolls the rest
+		if n_rows in size_by_rows:
+			return int(sh * size_by_rows[n_rows])
+		top = max(size_by_rows)
+		return min(int(sh * 0.9), int(sh * size_by_rows[top]) + (n_rows - top) * sheet['row_h'])
+
 	def set_geometry_for_rows(n_rows):
 		nonlocal auto_geometry, applying_geometry
 		if not auto_geometry:
 			return
-		perc_h = size_by_rows.get(n_rows, size_by_rows.get(max(size_by_rows), 0.6))
 		w = max(min_w, int(sw * perc_w))
-		h = max(min_h, int(sh * perc_h))
+		h = max(min_h, height_for_rows(n_rows))
 		x = (sw - w) // 2
 		y = (sh - h) // 2
 		applying_geometry = True
@@ -238,28 +268,28 @@ def main():
 	# We use Data Dragon as the authoritative source for champions/cooldowns.
 	# No CSV dependency is required.
 
-	# Prepare a list of champion display names for autocomplete.
-	# Use a per-user writable data directory so packaged exes can update the cache.
-
-	def get_user_data_dir():
-		if os.name == 'nt':
-			base = os.getenv('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
-		else:
-			base = os.getenv('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
-		path = os.path.join(base, 'LeagueSheet')
-		try:
-			os.makedirs(path, exist_ok=True)
-		except Exception:
-			pass
-		return path
- 
 	# Set up the main frame to fill the window
 	frame = ttk.Frame(root, padding=12)
 	frame.pack(fill='both', expand=True)
 
+	# Thread pool for background fetches (create before any submit). Sized so
+	# the icon fan-out of a full sheet (5 rows x 5 icons) is mostly in flight at once.
+	MAX_WORKERS = 16
+	executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS)
+	# Headless data layer: caches, pooled HTTP session, champion bundle and name
+	# resolution. LEAGUESHEET_OFFLINE=1 serves the last good patch only;
+	# LEAGUESHEET_LOCALE picks the starting language.
+	dd = DataDragon(max_workers=MAX_WORKERS, locale=os.getenv('LEAGUESHEET_LOCALE', DD_LOCALE))
+	# Row lookups run on a fetch engine: LEAGUESHEET_ENGINE=threads (default,
+	# task graphs on the pool above) or asyncio (one event loop thread).
+	engine = make_engine(None, dd, executor)
+
 	# Prepare a list of champion display names for autocomplete.
-	data_dir = get_user_data_dir()
+	data_dir = dd.data_dir
 	local_list_path = os.path.join(data_dir, 'champions.txt')
+	# Decoded PhotoImages in memory, keyed like the icon store: (version, image name, size).
+	# Only touched on the Tk thread.
+	photo_cache = {}
 	champion_list = []
 
 	# If the per-user champions cache is missing, try copying a bundled bootstrap.
@@ -277,38 +307,51 @@ def main():
 	frame['padding'] = 12
 	if os.path.exists(local_list_path):
 		try:
-			with open(local_list_path, encoding='utf-8') as f:
+			with open(local_list_path, encoding='utf-8-sig') as f:
 				champion_list = [line.strip() for line in f if line.strip()]
 		except Exception:
 			champion_list = []
 	if not champion_list:
 		try:
-			mapping, dd_version, display_names = load_champion_key_map()
+			_, dd_version, display_names = dd.load_champion_key_map()
 			champion_list = display_names
 		except Exception:
 			champion_list = []
 
+	list_on_disk = list(champion_list) if os.path.exists(local_list_path) else []
+
 	# status for champion updater (shows local/online update state)
 	status_var = tk.StringVar(value='Champion list: local (cached)')
-	# Thread pool for background fetches (create before any submit)
-	executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
 
 	def background_update_champion_file():
 		try:
 			# indicate update start in the UI
 			root.after(0, lambda: status_var.set('Updating champion list...'))
-			mapping, version, display_names = load_champion_key_map()
-			# write to local file
-			dirpath = os.path.dirname(local_list_path)
-			os.makedirs(dirpath, exist_ok=True)
-			with open(local_list_path, 'w', encoding='utf-8') as f:
-				for name in display_names:
-					f.write(name + '\n')
+			resolver, version, display_names = dd.load_champion_key_map()
+			# a sheet restored from the last session is now checked against the patch
+			root.after(0, lambda: revalidate_session(version))
+			# rewrite the local file only when the roster actually changed
+			if display_names != list_on_disk:
+				dirpath = os.path.dirname(local_list_path)
+				os.makedirs(dirpath, exist_ok=True)
+				with open(local_list_path, 'w', encoding='utf-8') as f:
+					for name in display_names:
+						f.write(name + '\n')
+			try:
+				on_build = lambda v: root.after(0, lambda: status_var.set(f'Building champion database ({v})...'))
+				dd.ensure_champion_db(version, executor=executor, on_build=on_build)
+				db_note = ''
+			except Exception:
+				db_note = ', database unavailable'
 			# update in-memory list on the main thread
 			def apply_update():
-				champion_list[:] = display_names
+				db = dd.current_db(version)
+				aliases = db.display_names() if db is not None else None
+				if display_names != champion_list or aliases != ac_state['aliases']:
+					champion_list[:] = display_names
+					rebuild_autocomplete_index(aliases)
 				# mark success with version
-				status_var.set(f'Champion list: updated ({version})')
+				status_var.set(f'Champion list: updated ({version}{db_note})')
 			root.after(0, apply_update)
 		except Exception:
 			# show failure briefly
@@ -317,66 +360,68 @@ def main():
 			except Exception:
 				pass
 
-	# submit the updater but don't block startup
-	executor.submit(background_update_champion_file)
-
 	# --- Data Dragon integration ---
-	# Cache and helper functions to fetch champion cooldowns from ddragon
-	DDRAGON_VERSIONS_URL = "https://ddragon.leagueoflegends.com/api/versions.json"
-	DD_BASE = "https://ddragon.leagueoflegends.com/cdn"
-
-	def get_latest_dd_version(timeout=5):
-		r = requests.get(DDRAGON_VERSIONS_URL, timeout=timeout)
-		r.raise_for_status()
-		return r.json()[0]
-
-	@lru_cache(maxsize=1)
-	def load_champion_key_map(version=None, timeout=5):
-		if not version:
-			version = get_latest_dd_version(timeout=timeout)
-		url = f"{DD_BASE}/{version}/data/en_US/champion.json"
-		r = requests.get(url, timeout=timeout)
-		r.raise_for_status()
-		data = r.json().get("data", {})
-		mapping = {}
-		display_names = set()
-		for key, info in data.items():
-			name = info.get('id', key)
-			display_names.add(name)
-			mapping[name.lower()] = key
-			mapping[key.lower()] = key
-			mapping[name.replace(' ', '').lower()] = key
-		# return mapping, version, and a sorted list of display names
-		return mapping, version, sorted(display_names, key=lambda s: s.lower())
-
-	@lru_cache(maxsize=256)
-	def fetch_champion_data(key, version, timeout=5):
-		url = f"{DD_BASE}/{version}/data/en_US/champion/{key}.json"
-		r = requests.get(url, timeout=timeout)
-		r.raise_for_status()
-		return r.json()["data"][key]
-
-	def get_champion_cooldowns_dd(champ_input_name, timeout=5):
-		name = (champ_input_name or '').strip()
-		if not name:
+	# Data access lives in leaguesheet.ddragon and the fetch engines. Icons
+	# then go through two stages: PNG -> raw RGBA on the worker pool
+	# (decode_icons), and RGBA -> PhotoImage on the Tk thread, in batches
+	# that yield back to the event loop once PHOTO_FRAME_BUDGET is spent.
+	PHOTO_FRAME_BUDGET = 0.008
+	photo_batches = collections.deque()
+	photo_pump = {'after': None}
+
+	def decode_icons(keys, pngs):
+		# worker thread: skip icons already on screen somewhere, decode the rest
+		out = []
+		for key, png in zip(keys, pngs):
+			if key in photo_cache or png is None:
+				out.append(None)
+				continue
+			try:
+				out.append(decode_rgba(png))
+			except Exception:
+				out.append(None)
+		return out
+
+	def make_photo(key, rgba):
+		photo = photo_cache.get(key)
+		if photo is not None:
+			metrics.count('photo_cache.hit')
+			return photo
+		if rgba is None:
 			return None
-		mapping, version, _ = load_champion_key_map()
-		lookup_keys = [name.lower(), name.replace(' ', '').lower()]
-		for k in lookup_keys:
-			if k in mapping:
-				champ_key = mapping[k]
-				data = fetch_champion_data(champ_key, version, timeout=timeout)
-				spells = data.get('spells', [])
-				slots = ["Q", "W", "E", "R"]
-				return {slot: spells[i].get('cooldownBurn', '-') for i, slot in enumerate(slots)}
-		# fallback startswith
-		for kname, key in mapping.items():
-			if kname.startswith(name.lower()):
-				data = fetch_champion_data(key, version, timeout=timeout)
-				spells = data.get('spells', [])
-				slots = ["Q", "W", "E", "R"]
-				return {slot: spells[i].get('cooldownBurn', '-') for i, slot in enumerate(slots)}
-		return None
+		metrics.count('photo_cache.miss')
+		w, h, buf = rgba
+		photo = ImageTk.PhotoImage(Image.frombuffer('RGBA', (w, h), buf, 'raw', 'RGBA', 0, 1))
+		photo_cache[key] = photo
+		return photo
+
+	def queue_photos(keys, decoded, assign):
+		# one batch per lookup; assign(i, photo) puts icon i on screen
+		photo_batches.append([0, keys, decoded, assign])
+		if photo_pump['after'] is None:
+			photo_pump['after'] = root.after(0, pump_photos)
+
+	def pump_photos():
+		photo_pump['after'] = None
+		deadline = time.perf_counter() + PHOTO_FRAME_BUDGET
+		with metrics.span('photo_batch') as sp:
+			made = 0
+			while photo_batches and time.perf_counter() < deadline:
+				batch = photo_batches[0]
+				i, keys, decoded, assign = batch
+				if i >= len(keys):
+					photo_batches.popleft()
+					continue
+				batch[0] = i + 1
+				try:
+					assign(i, make_photo(keys[i], decoded[i]))
+				except Exception:
+					pass
+				made += 1
+			sp['photos'] = made
+		if photo_batches:
+			# out of budget: let Tk handle input and redraws, then continue
+			photo_pump['after'] = root.after(1, pump_photos)
 
 	# Shared autocomplete Listbox with scrollbar (one visible at a time)
 	autocomplete_frame = tk.Frame(root, bd=1, relief='solid')
@@ -390,23 +435,71 @@ def main():
 
 	# active entry holder so listbox callbacks know which Entry to fill
 	active = {'entry': None}
+	# Search index over champion_list; rebuilt only when the list changes.
+	AUTOCOMPLETE_DELAY_MS = 60
+	ac_state = {'index': ChampionIndex(champion_list), 'aliases': None}
+
+	def rebuild_autocomplete_index(aliases=None):
+		ac_state['index'] = ChampionIndex(champion_list, aliases)
+		ac_state['aliases'] = aliases
+
+	# Mirror of the listbox contents so updates can be diffed instead of
+	# rebuilding the widget; typed queries are capped to a short list.
+	AUTOCOMPLETE_MAX_ITEMS = 40
+	listbox_items = []
+	placed_for = {'entry': None, 'row': None}
+
+	def sync_listbox(items):
+		# Keep the common head and tail, replace only the changed middle with
+		# one delete and one bulk insert.
+		old = listbox_items
+		n_old, n_new = len(old), len(items)
+		head = 0
+		while head < n_old and head < n_new and old[head] == items[head]:
+			head += 1
+		tail = 0
+		while tail < n_old - head and tail < n_new - head and old[n_old - 1 - tail] == items[n_new - 1 - tail]:
+			tail += 1
+		if head == n_old == n_new:
+			return
+		if n_old - tail > head:
+			autocomplete_box.delete(head, n_old - tail - 1)
+		if n_new - tail > head:
+			autocomplete_box.insert(head, *items[head:n_new - tail])
+		listbox_items[:] = items
+		autocomplete_box.selection_clear(0, tk.END)
+		autocomplete_box.yview_moveto(0)
 
 	def show_autocomplete(entry, items):
 		if not items:
-			autocomplete_frame.place_forget()
+			hide_autocomplete()
+			return
+		sync_listbox(items)
+		if placed_for['entry'] is entry:
 			return
-		autocomplete_box.delete(0, tk.END)
-		for it in items:
-			autocomplete_box.insert(tk.END, it)
-		# position the listbox directly under the entry
-		x = entry.winfo_rootx() - root.winfo_rootx()
-		y = entry.winfo_rooty() - root.winfo_rooty() + entry.winfo_height()
+		place_autocomplete(entry)
+
+	def place_autocomplete(entry):
+		# position the listbox directly under the entry; a sheet entry is
+		# placed from its row's canvas position, which is already current
+		# right after a scroll, before the canvas has moved its widgets
+		slot = next((s for s in slots if s['entry'] is entry), None)
+		if slot is not None and slot['row'] is not None:
+			x = canvas.winfo_rootx() - root.winfo_rootx() - int(canvas.canvasx(0)) + entry.winfo_x()
+			y = (canvas.winfo_rooty() - root.winfo_rooty() + slot['row'] * sheet['row_h'] - int(canvas.canvasy(0))
+				+ entry.winfo_y() + entry.winfo_height())
+		else:
+			x = entry.winfo_rootx() - root.winfo_rootx()
+			y = entry.winfo_rooty() - root.winfo_rooty() + entry.winfo_height()
 		w = entry.winfo_width()
 		autocomplete_frame.place(x=x, y=y, width=w + 18)  # add space for scrollbar
 		autocomplete_frame.lift()
+		placed_for['entry'] = entry
+		placed_for['row'] = slot['row'] if slot is not None else None
 
 	def hide_autocomplete():
 		autocomplete_frame.place_forget()
+		placed_for.update(entry=None, row=None)
 
 	def pick_current(event=None):
 		sel = autocomplete_box.curselection()
@@ -424,6 +517,21 @@ def main():
 	autocomplete_box.bind('<Escape>', lambda e: hide_autocomplete())
 
 	def attach_autocomplete(entry):
+		pending = {'after': None}
+
+		def run_search():
+			pending['after'] = None
+			text = entry.get().strip()
+			if text:
+				matches = ac_state['index'].search(text, limit=AUTOCOMPLETE_MAX_ITEMS)
+			else:
+				matches = champion_list[:AUTOCOMPLETE_MAX_ITEMS]
+			if matches:
+				active['entry'] = entry
+				show_autocomplete(entry, matches)
+			else:
+				hide_autocomplete()
+
 		def on_keyrelease(event):
 			key = event.keysym
 			# if user navigates down, focus listbox
@@ -438,21 +546,22 @@ def main():
 				if key == 'Escape':
 					hide_autocomplete()
 				return
-			text = entry.get().strip().lower()
-			if not text:
-				matches = champion_list
-			else:
-				matches = [c for c in champion_list if c.lower().startswith(text)]
-			if matches:
-				active['entry'] = entry
-				show_autocomplete(entry, matches)
-			else:
-				hide_autocomplete()
+			# debounce: only search once typing pauses
+			if pending['after'] is not None:
+				root.after_cancel(pending['after'])
+			pending['after'] = root.after(AUTOCOMPLETE_DELAY_MS, run_search)
+
+		def on_focusout(event):
+			# a search still waiting on the debounce must not reopen the list
+			if pending['after'] is not None:
+				root.after_cancel(pending['after'])
+				pending['after'] = None
+			# small delay to allow clicks into the listbox to register
+			root.after(150, hide_autocomplete)
 
 		entry.bind('<KeyRelease>', on_keyrelease)
-		# small delay to allow clicks into the listbox to register
-		entry.bind('<FocusOut>', lambda e: root.after(150, hide_autocomplete))
-		entry.bind('<FocusIn>', lambda e, ent=entry: (clear_placeholder(ent), active.update({'entry': ent}), show_autocomplete(ent, champion_list)))
+		entry.bind('<FocusOut>', on_focusout)
+		entry.bind('<FocusIn>', lambda e, ent=entry: (clear_placeholder(ent), active.update({'entry': ent}), show_autocomplete(ent, champion_list[:AUTOCOMPLETE_MAX_ITEMS])))
 
 	# No CSV lookups: DDragon is the authoritative source for champion data.
 
@@ -475,24 +584,30 @@ def main():
 	# Returned fields (we use DDragon cooldowns: Q/W/E/R)
 	returned_fields = ['Q', 'W', 'E', 'R']
 
-	# Header labels for the spell columns (Q/W/E/R)
-	# Place headers on row 1 so the controls_frame (row 0) does not overlap them
-	for i, fld in enumerate(returned_fields):
-		tk.Label(frame, text=fld).grid(row=1, column=3 + i, sticky='w', padx=(0, 6), pady=(0, 6))
-
-	# Rows controller: allow selecting 1-5 visible rows
+	# Sheet model: one dict per logical row (name, lookup state, results), as
+	# many as the row count asks for. Widgets come from a small pool of row
+	# slots in a scrolling canvas: only rows in view are bound to a slot, and
+	# a slot scrolled onto another row is rebound rather than recreated.
+	# LEAGUESHEET_MAX_ROWS caps the row count (default 50).
+	try:
+		max_rows = max(1, int(os.getenv('LEAGUESHEET_MAX_ROWS', '50')))
+	except ValueError:
+		max_rows = 50
+	default_rows = min(5, max_rows)
 	rows = []
-	max_rows = 5
-	base_row = 2  # header is at row 1
+	slots = []
+	sheet = {'count': default_rows, 'row_h': 40, 'row_w': 0, 'cols': None, 'layout': None}
 
 	# Controls row: Champions label + number-of-inputs selector
 	controls_frame = ttk.Frame(frame)
-	controls_frame.grid(row=0, column=0, columnspan=5, sticky='w', pady=(0, 6))
+	controls_frame.grid(row=0, column=0, columnspan=2, sticky='w', pady=(0, 6))
 	tk.Label(controls_frame, text='Champions:').pack(side='left')
-	row_count_var = tk.IntVar(value=max_rows)
-	row_options = [str(i) for i in range(1, max_rows + 1)]
+	row_options = [str(i) for i in range(1, min(max_rows, 10) + 1)]
+	row_options += [str(i) for i in (15, 20, 30, 40, 50) if 10 < i < max_rows]
+	if str(max_rows) not in row_options:
+		row_options.append(str(max_rows))
 	rows_combo = ttk.Combobox(controls_frame, values=row_options, width=3, state='readonly')
-	rows_combo.set(str(max_rows))
+	rows_combo.set(str(default_rows))
 	rows_combo.pack(side='left', padx=(6, 12))
 
 	# Status label for champion updater
@@ -504,6 +619,40 @@ def main():
 	ttk.Label(controls_frame, text='View:').pack(side='left', padx=(8, 0))
 	view_combo = ttk.Combobox(controls_frame, values=view_options, textvariable=view_mode_var, width=12, state='readonly')
 	view_combo.pack(side='left', padx=(4, 12))
+	# Rank selector: show one ability rank instead of every rank
+	rank_var = tk.StringVar(value='All')
+	ttk.Label(controls_frame, text='Rank:').pack(side='left', padx=(0, 0))
+	rank_options = ['All', '1', '2', '3', '4', '5']
+	rank_combo = ttk.Combobox(controls_frame, values=rank_options, textvariable=rank_var, width=4, state='readonly')
+	rank_combo.pack(side='left', padx=(4, 12))
+	# Language of names and tooltips. Switching fetches only the new locale's
+	# strings: records, numbers and icons are shared across languages.
+	locale_var = tk.StringVar(value=dd.locale)
+	ttk.Label(controls_frame, text='Language:').pack(side='left')
+	locale_combo = ttk.Combobox(controls_frame, values=list(LOCALES), textvariable=locale_var, width=7, state='readonly')
+	locale_combo.pack(side='left', padx=(4, 12))
+
+	def current_rank():
+		value = rank_var.get()
+		return int(value) if value.isdigit() else None
+
+	def rerender_rows(event=None):
+		# view mode / rank changes re-render the rows in view from the records
+		# already shown; tooltips come from the renderer's cache, nothing is
+		# fetched. Rows scrolled away render when they're bound again.
+		for slot in slots:
+			if slot['row'] is not None:
+				paint_row(slot['row'])
+	view_combo.bind('<<ComboboxSelected>>', rerender_rows)
+	rank_combo.bind('<<ComboboxSelected>>', rerender_rows)
+
+	def change_locale(event=None):
+		dd.set_locale(locale_var.get())
+		# re-run the rows: records and icons come from the caches, only the
+		# new language's strings are fetched
+		return_all()
+
+	locale_combo.bind('<<ComboboxSelected>>', change_locale)
 	# Hotkey controls: allow user to set the toggle shortcut
 	ttk.Label(controls_frame, text='Hotkey:').pack(side='left', padx=(4, 0))
 	hotkey_entry = ttk.Entry(controls_frame, textvariable=hk_input_var, width=14)
@@ -511,227 +660,704 @@ def main():
 	ttk.Button(controls_frame, text='Set', command=lambda: apply_hotkey(hk_input_var.get())).pack(side='left', padx=(2, 6))
 	tk.Label(controls_frame, textvariable=hotkey_status).pack(side='left')
 
+	def import_archive():
+		# Offline data: stream a downloaded dragontail-<version>.tgz into the caches.
+		path = filedialog.askopenfilename(
+			title='Import Data Dragon archive',
+			filetypes=[('Data Dragon archive', '*.tgz *.tar.gz'), ('All files', '*.*')],
+		)
+		if not path:
+			return
+
+		def run():
+			progress = lambda n, c: root.after(0, lambda: status_var.set(f'Importing archive... {c["json"]} json, {c["icons"]} icons'))
+			try:
+				version, counts = import_dragontail(path, dd.dd_cache, dd.icon_store, (dd.data_locale, dd.locale), progress)
+			except Exception:
+				root.after(0, lambda: status_var.set('Archive import failed'))
+				return
+			root.after(0, lambda: status_var.set(f'Imported {version}: {counts["json"]} json, {counts["icons"]} icons'))
+			# reload the champion list (and bundle) from the freshly imported data
+			dd.load_champion_key_map.cache_clear()
+			background_update_champion_file()
+
+		executor.submit(run)
+
+	ttk.Button(controls_frame, text='Import...', command=import_archive).pack(side='left', padx=(8, 0))
+
+	# Optional stats panel: per-phase timings and cache counters for this session.
+	stats_window = {'win': None}
+
+	def open_stats():
+		if stats_window['win'] is not None and stats_window['win'].winfo_exists():
+			stats_window['win'].lift()
+			return
+		win = tk.Toplevel(root)
+		win.title('LeagueSheet - Stats')
+		stats_window['win'] = win
+		text = tk.Text(win, width=72, height=24, font='TkFixedFont', state='disabled')
+		text.pack(fill='both', expand=True, padx=8, pady=(8, 4))
+
+		def refresh():
+			if not win.winfo_exists():
+				return
+			text.configure(state='normal')
+			text.delete('1.0', tk.END)
+			text.insert('1.0', metrics.METRICS.format_table())
+			text.configure(state='disabled')
+			win.after(1000, refresh)
+
+		def export(kind):
+			path = filedialog.asksaveasfilename(
+				parent=win,
+				title='Export Chrome trace' if kind == 'trace' else 'Export stats JSON',
+				defaultextension='.json',
+				filetypes=[('JSON', '*.json')],
+			)
+			if not path:
+				return
+			if kind == 'trace':
+				metrics.METRICS.export_chrome_trace(path)
+			else:
+				metrics.METRICS.export_json(path)
+
+		buttons = ttk.Frame(win)
+		buttons.pack(fill='x', padx=8, pady=(0, 8))
+		ttk.Button(buttons, text='Export trace...', command=lambda: export('trace')).pack(side='left')
+		ttk.Button(buttons, text='Export JSON...', command=lambda: export('json')).pack(side='left', padx=(6, 0))
+		ttk.Button(buttons, text='Reset', command=metrics.METRICS.reset).pack(side='right')
+		refresh()
+
+	ttk.Button(controls_frame, text='Stats', command=open_stats).pack(side='left', padx=(6, 0))
+
+	# Roster-wide cooldown table: every champion x Q/W/E/R, scaled by ability
+	# haste. The matrix is built once per patch; haste, filters and sorting
+	# only re-slice it.
+	matrix_window = {'win': None}
+
+	def open_matrix():
+		if matrix_window['win'] is not None and matrix_window['win'].winfo_exists():
+			matrix_window['win'].lift()
+			return
+		win = tk.Toplevel(root)
+		win.title('LeagueSheet - Roster cooldowns')
+		matrix_window['win'] = win
+		state = {'matrix': None, 'sort': None, 'desc': False}
+		haste_var = tk.StringVar(value='0')
+		matrix_rank_var = tk.StringVar(value='All')
+		slot_var = tk.StringVar(value='Any')
+		max_var = tk.StringVar(value='')
+		name_var = tk.StringVar(value='')
+		info_var = tk.StringVar(value='Loading roster...')
+
+		opts = ttk.Frame(win)
+		opts.pack(fill='x', padx=8, pady=(8, 4))
+		ttk.Label(opts, text='Ability haste:').pack(side='left')
+		ttk.Spinbox(opts, from_=0, to=500, increment=5, textvariable=haste_var, width=5).pack(side='left', padx=(2, 8))
+		ttk.Label(opts, text='Rank:').pack(side='left')
+		matrix_rank_combo = ttk.Combobox(opts, values=['All'], textvariable=matrix_rank_var, width=4, state='readonly')
+		matrix_rank_combo.pack(side='left', padx=(2, 8))
+		ttk.Label(opts, text='Show').pack(side='left')
+		ttk.Combobox(opts, values=['Any'] + returned_fields, textvariable=slot_var, width=4, state='readonly').pack(side='left', padx=2)
+		ttk.Label(opts, text='under').pack(side='left')
+		ttk.Entry(opts, textvariable=max_var, width=5).pack(side='left', padx=2)
+		ttk.Label(opts, text='s').pack(side='left', padx=(0, 8))
+		ttk.Label(opts, text='Name:').pack(side='left')
+		ttk.Entry(opts, textvariable=name_var, width=14).pack(side='left', padx=(2, 0))
+
+		table = ttk.Frame(win)
+		table.pack(fill='both', expand=True, padx=8)
+		columns = ['Champion'] + returned_fields
+		tree = ttk.Treeview(table, columns=columns, show='headings', height=20)
+		for col in columns:
+			tree.column(col, width=160 if col == 'Champion' else 130, anchor='w')
+		scroll = ttk.Scrollbar(table, orient='vertical', command=tree.yview)
+		tree.configure(yscrollcommand=scroll.set)
+		tree.pack(side='left', fill='both', expand=True)
+		scroll.pack(side='right', fill='y')
+		tk.Label(win, textvariable=info_var, anchor='w').pack(fill='x', padx=8, pady=(4, 8))
+
+		def number(text):
+			try:
+				return float(text)
+			except ValueError:
+				return None
+
+		def redraw(*_):
+			matrix = state['matrix']
+			if matrix is None or not win.winfo_exists():
+				return
+			haste = number(haste_var.get()) or 0
+			rank = None if matrix_rank_var.get() == 'All' else int(matrix_rank_var.get())
+			slot = returned_fields.index(slot_var.get()) if slot_var.get() in returned_fields else None
+			with metrics.span('matrix_redraw'):
+				idx = matrix.select(haste=haste, rank=rank or 1, slot=slot, max_cd=number(max_var.get()),
+					name=name_var.get().strip(), sort=state['sort'], descending=state['desc'])
+				tree.delete(*tree.get_children())
+				for i in idx:
+					tree.insert('', 'end', values=[matrix.names[i]] + matrix.cells(i, haste, rank))
+			info_var.set(f'{len(idx)} of {len(matrix)} champions ({matrix.version})')
+
+		def sort_by(col):
+			# click a heading to sort by it; click again to reverse
+			key = None if col == 'Champion' else returned_fields.index(col)
+			state['desc'] = not state['desc'] if state['sort'] == key else False
+			state['sort'] = key
+			redraw()
+
+		for col in columns:
+			tree.heading(col, text=col, command=lambda c=col: sort_by(c))
+		for var in (haste_var, matrix_rank_var, slot_var, max_var, name_var):
+			var.trace_add('write', redraw)
+
+		def loaded(fut):
+			def apply():
+				if not win.winfo_exists():
+					return
+				try:
+					matrix = fut.result()
+				except Exception:
+					info_var.set('Roster unavailable')
+					return
+				state['matrix'] = matrix
+				matrix_rank_combo.configure(values=['All'] + [str(r) for r in range(1, matrix.ranks + 1)])
+				redraw()
+			root.after(0, apply)
+
+		executor.submit(dd.cooldown_matrix, None, executor).add_done_callback(loaded)
+
+	ttk.Button(controls_frame, text='Roster...', command=open_matrix).pack(side='left', padx=(6, 0))
+
 	# DDragon is the default source; no CSV toggle required.
 
-	def make_row(index):
-		# index is 0-based logical row index; grid row will be base_row + index
-		grid_row = base_row + index
-		# per-row 'Name:' label and champion entry
-		lbl_name = ttk.Label(frame, text='Name:')
-		lbl_name.grid(row=grid_row, column=0, sticky='w', padx=(0, 6), pady=6)
-		e = ttk.Entry(frame, width=36)
-		e.grid(row=grid_row, column=1, padx=(0, 6), pady=6)
+	# Header row, the scrolling sheet and the global buttons
+	header_frame = ttk.Frame(frame)
+	header_frame.grid(row=1, column=0, columnspan=2, sticky='w')
+	for i, fld in enumerate(returned_fields):
+		tk.Label(header_frame, text=fld).grid(row=0, column=3 + i, sticky='w', pady=(0, 6))
+	canvas = tk.Canvas(frame, highlightthickness=0, borderwidth=0)
+	canvas.grid(row=2, column=0, sticky='nsew')
+	sheet_scroll = ttk.Scrollbar(frame, orient='vertical', command=lambda *a: (hide_autocomplete(), canvas.yview(*a)))
+	sheet_scroll.grid(row=2, column=1, sticky='ns')
+	frame.grid_rowconfigure(2, weight=1)
+	frame.grid_columnconfigure(0, weight=1)
+
+	def new_row_model():
+		return {'name': '', 'gen': 0, 'task': None, 'shown': None, 'missing': False,
+			'icon_keys': [], 'decoded': [], 'photos': [None] * (len(returned_fields) + 1), 'slot': None}
+
+	def ensure_rows(n):
+		while len(rows) < n:
+			rows.append(new_row_model())
+
+	def reset_row(model):
+		# invalidate any lookup still in flight and drop the shown result
+		model['gen'] += 1
+		model.update(shown=None, missing=False, icon_keys=[], decoded=[])
+		model['photos'] = [None] * len(model['photos'])
+
+	def on_wheel(event):
+		if event.num == 4:
+			step = -1
+		elif event.num == 5:
+			step = 1
+		else:
+			step = -max(1, abs(event.delta) // 120) if event.delta > 0 else max(1, abs(event.delta) // 120)
+		hide_autocomplete()
+		canvas.yview_scroll(step, 'units')
+		return 'break'
+
+	def make_slot():
+		# one reusable row of widgets; bind_slot() points it at a row model
+		f = ttk.Frame(canvas)
+		lbl_name = ttk.Label(f, text='Name:')
+		lbl_name.grid(row=0, column=0, sticky='w', padx=(0, 6), pady=6)
+		e = ttk.Entry(f, width=36)
+		e.grid(row=0, column=1, padx=(0, 6), pady=6)
 		put_placeholder(e)
 		e.bind('<FocusIn>', lambda ev, ent=e: clear_placeholder(ent))
 		e.bind('<FocusOut>', lambda ev, ent=e: ensure_placeholder(ent))
-		champ_icon = ttk.Label(frame)
-		champ_icon.grid(row=grid_row, column=2, padx=(0, 6), pady=6)
+		champ_icon = ttk.Label(f)
+		champ_icon.grid(row=0, column=2, padx=(0, 6), pady=6)
 
 		# attach autocomplete behavior to this entry
 		attach_autocomplete(e)
 
-		rv = tk.StringVar(value='')
-
 		# create one label per returned field so headers align with values
 		val_labels = []
 		rvs = []
 		for i in range(len(returned_fields)):
 			v = tk.StringVar(value='')
 			# allow wider labels to accommodate descriptions
-			lbl = ttk.Label(frame, textvariable=v, width=40, anchor='w', compound='left')
-			lbl.grid(row=grid_row, column=3 + i, sticky='w')
+			lbl = ttk.Label(f, textvariable=v, width=40, anchor='w', compound='left')
+			lbl.grid(row=0, column=3 + i, sticky='w')
 			val_labels.append(lbl)
 			rvs.append(v)
 
-		rows.append({'label': lbl_name, 'entry': e, 'icon': champ_icon, 'icon_img': None, 'val_labels': val_labels, 'rvs': rvs, 'rv_imgs': [None]*len(returned_fields)})
+		slot = {'frame': f, 'entry': e, 'icon': champ_icon, 'val_labels': val_labels, 'rvs': rvs, 'row': None}
+		slot['window'] = canvas.create_window(0, 0, window=f, anchor='nw', state='hidden')
+		for w in (f, lbl_name, e, champ_icon, *val_labels):
+			w.bind('<MouseWheel>', on_wheel, add='+')
+			w.bind('<Button-4>', on_wheel, add='+')
+			w.bind('<Button-5>', on_wheel, add='+')
+		e.bind('<FocusIn>', lambda ev, s=slot: see_row(s['row']), add='+')
+		e.bind('<Tab>', lambda ev, s=slot: focus_row(s['row'], 1))
+		e.bind('<Shift-Tab>', lambda ev, s=slot: focus_row(s['row'], -1))
+		e.bind('<ISO_Left_Tab>', lambda ev, s=slot: focus_row(s['row'], -1))
+		slots.append(slot)
+		if not sheet['cols']:
+			# every slot gets the same fixed grid, sized for the icons it will
+			# show, so rows line up with each other and with the header
+			icon = ICON_SIZES['champion'] + 4
+			sheet['cols'] = [lbl_name.winfo_reqwidth() + 6, e.winfo_reqwidth() + 6, icon + 6]
+			sheet['cols'] += [lbl.winfo_reqwidth() + ICON_SIZES['spell'] + 4 for lbl in val_labels]
+			sheet['row_h'] = max(e.winfo_reqheight(), icon) + 12
+			sheet['row_w'] = sum(sheet['cols'])
+			canvas.configure(width=sheet['row_w'], yscrollincrement=sheet['row_h'])
+			for c, width in enumerate(sheet['cols']):
+				header_frame.grid_columnconfigure(c, minsize=width)
+		for c, width in enumerate(sheet['cols']):
+			f.grid_columnconfigure(c, minsize=width)
+		f.grid_rowconfigure(0, minsize=sheet['row_h'])
+		return slot
+
+	def sync_slot(slot):
+		# the entry is the only slot state the user edits; fold it back into the row
+		if slot['row'] is None:
+			return
+		e = slot['entry']
+		rows[slot['row']]['name'] = '' if getattr(e, '_placeholder', False) else e.get()
+
+	def sync_slots():
+		for slot in slots:
+			sync_slot(slot)
+
+	def load_entry(slot):
+		e = slot['entry']
+		name = rows[slot['row']]['name']
+		e.delete(0, tk.END)
+		if name.strip():
+			e.insert(0, name)
+			e._placeholder = False
+		else:
+			put_placeholder(e)
+
+	def bind_slot(slot, index):
+		if slot['row'] == index:
+			return
+		sync_slot(slot)
+		if slot['row'] is not None:
+			rows[slot['row']]['slot'] = None
+		slot['row'] = index
+		if index is None:
+			canvas.itemconfigure(slot['window'], state='hidden')
+			return
+		rows[index]['slot'] = slot
+		load_entry(slot)
+		canvas.coords(slot['window'], 0, index * sheet['row_h'])
+		canvas.itemconfigure(slot['window'], state='normal')
+		paint_row(index)
+
+	def refresh_slots():
+		# model changed under the bound rows (pack, clear, live fill): reload them
+		for slot in slots:
+			if slot['row'] is not None:
+				load_entry(slot)
+				paint_row(slot['row'])
+
+	def paint_row(index):
+		# render a row's model into its slot; no-op for rows out of view
+		model = rows[index]
+		slot = model['slot']
+		if slot is None:
+			return
+		shown = model['shown']
+		mode = view_mode_var.get()
+		rank = current_rank()
+		for i, v in enumerate(slot['rvs']):
+			if shown:
+				v.set(spell_text(shown[0], shown[1], i, mode, rank))
+			else:
+				v.set('Champion not found' if model['missing'] else '')
+		photos = model['photos']
+		slot['icon'].configure(image=photos[0] or '')
+		for i, lbl in enumerate(slot['val_labels']):
+			lbl.configure(image=photos[i + 1] or '')
+		if model['decoded']:
+			# icons decoded while the row was out of view become PhotoImages
+			# only now that it is on screen
+			keys, decoded, gen = model['icon_keys'], model['decoded'], model['gen']
+			model['decoded'] = []
+			queue_photos(keys, decoded, lambda i, photo: set_photo(index, gen, i, photo))
+
+	def set_photo(index, gen, i, photo):
+		model = rows[index]
+		if model['gen'] != gen:
+			return
+		model['photos'][i] = photo
+		slot = model['slot']
+		if slot is None:
+			return
+		if i == 0:
+			slot['icon'].configure(image=photo or '')
+		else:
+			slot['val_labels'][i - 1].configure(image=photo or '')
+
+	def visible_range():
+		# [first, last) rows intersecting the canvas viewport
+		row_h = sheet['row_h']
+		top = int(canvas.canvasy(0))
+		height = canvas.winfo_height()
+		if height <= 1:
+			height = int(canvas.cget('height'))
+		first = max(0, min(sheet['count'] - 1, top // row_h))
+		last = min(sheet['count'], (top + height) // row_h + 1)
+		return first, last
+
+	def layout_visible():
+		sheet['layout'] = None
+		first, last = visible_range()
+		wanted = set(range(first, last))
+		free = []
+		for slot in slots:
+			if slot['row'] in wanted:
+				wanted.discard(slot['row'])
+			else:
+				free.append(slot)
+		for index in sorted(wanted):
+			bind_slot(free.pop() if free else make_slot(), index)
+		for slot in free:
+			bind_slot(slot, None)
+		# focusing an entry may have scrolled the sheet after the dropdown
+		# was placed; keep it under its entry, or drop it with the row
+		entry = placed_for['entry']
+		slot = next((s for s in slots if s['entry'] is entry), None)
+		if slot is not None:
+			if slot['row'] is None or slot['row'] != placed_for['row']:
+				hide_autocomplete()
+			else:
+				place_autocomplete(entry)
+
+	def schedule_layout(event=None):
+		if sheet['layout'] is None:
+			sheet['layout'] = root.after_idle(layout_visible)
 
-	# create all rows (they will be shown/hidden by update_rows)
-	for i in range(max_rows):
-		make_row(i)
+	def on_yscroll(first, last):
+		sheet_scroll.set(first, last)
+		schedule_layout()
+
+	canvas.configure(yscrollcommand=on_yscroll)
+	canvas.bind('<Configure>', schedule_layout, add='+')
+	canvas.bind('<MouseWheel>', on_wheel)
+	canvas.bind('<Button-4>', on_wheel)
+	canvas.bind('<Button-5>', on_wheel)
+
+	def see_row(index):
+		if index is None:
+			return
+		row_h = sheet['row_h']
+		total = max(1, sheet['count'] * row_h)
+		top = canvas.canvasy(0)
+		height = canvas.winfo_height()
+		y = index * row_h
+		if y < top:
+			canvas.yview_moveto(y / total)
+		elif y + row_h > top + height:
+			canvas.yview_moveto(max(0, y + row_h - height) / total)
+
+	def focus_row(index, step):
+		# Tab follows row order, not slot creation order
+		if index is None or not 0 <= index + step < sheet['count']:
+			return None
+		target = index + step
+		see_row(target)
+		layout_visible()
+		slot = rows[target]['slot']
+		if slot is not None:
+			slot['entry'].focus_set()
+		return 'break'
+
+	# the first slot fixes the row pitch and column widths
+	make_slot()
 
 	def update_rows(event=None):
 		try:
 			n = int(rows_combo.get())
 		except Exception:
-			n = max_rows
-		for idx, r in enumerate(rows):
-			if idx < n:
-				# show
-				r['label'].grid()
-				r['entry'].grid()
-				r['icon'].grid()
-				for lbl in r['val_labels']:
-					lbl.grid()
-			else:
-				# hide
-				r['label'].grid_remove()
-				r['entry'].grid_remove()
-				r['icon'].configure(image='')
-				r['icon'].grid_remove()
-				for lbl in r['val_labels']:
-					lbl.grid_remove()
-				# show/hide per-row label, entry, and value labels
+			n = default_rows
+		n = max(1, min(max_rows, n))
+		ensure_rows(n)
+		sheet['count'] = n
+		canvas.configure(scrollregion=(0, 0, sheet['row_w'], n * sheet['row_h']),
+			height=min(n, 10) * sheet['row_h'])
 		set_geometry_for_rows(n)
+		schedule_layout()
 
 	rows_combo.bind('<<ComboboxSelected>>', update_rows)
 
 	def return_all(event=None):
-		try:
-			n = int(rows_combo.get())
-		except Exception:
-			n = max_rows
+		sync_slots()
 
 		# gather only non-placeholder names
-		names = []
-		for r in rows:
-			name = r['entry'].get().strip()
-			if name and not getattr(r['entry'], '_placeholder', False):
-				names.append(name)
+		names = [r['name'].strip() for r in rows if r['name'].strip()]
 
-		# rewrite entries so filled names are packed at the top, placeholders below
+		# rewrite rows so filled names are packed at the top, placeholders below
 		for i, r in enumerate(rows):
-			r['entry'].delete(0, tk.END)
 			if i < len(names):
-				r['entry'].insert(0, names[i])
-				r['entry']._placeholder = False
+				r['name'] = names[i]
 			else:
-				put_placeholder(r['entry'])
-				for v in r['rvs']:
-					v.set('')
+				r['name'] = ''
+				reset_row(r)
 		n = len(names) if names else 1
 		rows_combo.set(str(n))
 		update_rows()
+		refresh_slots()
 
-		# Always use Data Dragon in background threads
-	        # Always use Data Dragon in background threads
-		# Always use Data Dragon in background threads
+		# Each row is one engine task: resolve name -> champion JSON -> all five
+		# icons concurrently. Rows run side by side; results come back to the Tk
+		# thread through root.after.
 		def make_task(index, name):
-			def task():
-				mode = view_mode_var.get()
-				icon_image = None
-				result_icons = {slot: None for slot in returned_fields}
-				result = None
+			mode = view_mode_var.get()
+			rank = current_rank()
+			started = metrics.begin()
+			model = rows[index]
+			model['gen'] += 1
+			gen = model['gen']
+			# a newer lookup supersedes the old one outright
+			previous = model.get('task')
+			if previous is not None:
+				previous.cancel()
+
+			def is_current():
+				return model['gen'] == gen
+
+			def finish(fut):
+				if fut.cancelled():
+					return
+				shown = None
+				icon_keys = []
+				icon_pngs = []
 				try:
-					print(f"[lookup] row={index} name={name} mode={mode}")
-					# resolve champ key
-					mapping, version, _ = load_champion_key_map()
-					lookup_keys = [name.lower(), name.replace(' ', '').lower()]
-					champ_key = None
-					for k in lookup_keys:
-						if k in mapping:
-							champ_key = mapping[k]
-							break
-					if not champ_key:
-						for kname, key in mapping.items():
-							if kname.startswith(name.lower()):
-								champ_key = key
-								break
-					if champ_key:
-						data = fetch_champion_data(champ_key, version)
-						# champion icon
-						champ_img = (data.get('image') or {}).get('full')
-						if champ_img:
-							try:
-								url = f"{DD_BASE}/{version}/img/champion/{champ_img}"
-								resp = requests.get(url, timeout=5)
-								resp.raise_for_status()
-								im = Image.open(io.BytesIO(resp.content))
-								im = im.resize((48, 48), Image.LANCZOS)
-								icon_image = ImageTk.PhotoImage(im)
-							except Exception:
-								icon_image = None
-						# spells
-						spells = data.get('spells', [])
-						result = {}
-						slots = ['Q', 'W', 'E', 'R']
-						for i, slot in enumerate(slots):
-							val = '-'
-							try:
-								spell = spells[i]
-								if mode == 'Cooldown':
-									val = spell.get('cooldownBurn', '-')
-								else:
-									val = spell.get('tooltip') or spell.get('description') or '-'
-								img_full = (spell.get('image') or {}).get('full')
-								if img_full:
-									try:
-										url = f"{DD_BASE}/{version}/img/spell/{img_full}"
-										resp = requests.get(url, timeout=5)
-										resp.raise_for_status()
-										im = Image.open(io.BytesIO(resp.content))
-										im = im.resize((32, 32), Image.LANCZOS)
-										result_icons[slot] = ImageTk.PhotoImage(im)
-									except Exception:
-										result_icons[slot] = None
-							except Exception:
-								val = '-'
-							result[slot] = val
-					print(f"[lookup] row={index} result={result}")
+					row = fut.result()
+					if row:
+						data = row['data']
+						shown = (row['version'], data)
+						icon_keys = [(row['version'], f'{kind}/{image.full}', size) for kind, image, size in icon_specs(data)]
+						icon_pngs = row['icons']
+						# render here so the Tk thread only reads the tooltip cache
+						for i in range(len(returned_fields)):
+							spell_text(row['version'], data, i, mode, rank)
 				except Exception as exc:
-					result = None
-					print(f"[lookup:error] row={index} name={name} -> {exc}")
+					metrics.event('lookup_error', row=index, name=name, error=repr(exc))
+				decoded = decode_icons(icon_keys, icon_pngs) if is_current() else []
+				metrics.end('lookup_row', started, row=index, name=name, found=shown is not None, engine=engine.name)
 
 				def apply_result():
 					if not root.winfo_exists():
 						return
+					if not is_current():
+						metrics.count('lookup.stale_dropped')
+						return
 					try:
-						print(f"[apply] row={index} result={result}")
-						if result:
-							for i, fld in enumerate(returned_fields):
-								key = fld[0].upper()
-								rows[index]['rvs'][i].set(result.get(key, '-'))
-								img = result_icons.get(key)
-								rows[index]['rv_imgs'][i] = img
-								rows[index]['val_labels'][i].configure(image=img or '')
-						else:
-							for v in rows[index]['rvs']:
-								v.set('Champion not found')
-						if icon_image:
-							rows[index]['icon_img'] = icon_image
-							rows[index]['icon'].configure(image=icon_image)
-						else:
-							rows[index]['icon'].configure(image='')
+						with metrics.span('apply_result', row=index):
+							apply_row()
 					except Exception:
 						# If the UI is already torn down, ignore update
 						pass
 
-				if root.winfo_exists():
-					try:
-						root.after(0, apply_result)
-					except Exception:
-						pass
-			return task
+				def apply_row():
+					# text right away (current view/rank, in case they changed
+					# while this ran); icons follow through the photo batches
+					model['shown'] = shown
+					model['missing'] = shown is None
+					model['icon_keys'] = icon_keys
+					model['decoded'] = decoded if shown else []
+					# never leave the previous champion's icons beside the new
+					# text; icons already made show at once, the rest follow
+					photos = [photo_cache.get(key) for key in icon_keys] if shown else []
+					model['photos'] = (photos + [None] * len(model['photos']))[:len(model['photos'])]
+					paint_row(index)
 
-		for idx in range(n):
-			name = rows[idx]['entry'].get().strip()
-			if name and not getattr(rows[idx]['entry'], '_placeholder', False):
-				executor.submit(make_task(idx, name))
+				try:
+					root.after(0, apply_result)
+				except Exception:
+					pass
+
+			fut = engine.lookup_row(name, is_current)
+			model['task'] = fut
+			# finish (and icon decoding) always runs on the pool, never on the
+			# asyncio engine's loop thread
+			def on_done(f):
+				try:
+					executor.submit(finish, f)
+				except RuntimeError:
+					# pool already shut down: the window is closing
+					pass
+
+			fut.add_done_callback(on_done)
+			return fut
+
+		# rows in view go first so they fill in before the ones scrolled away
+		first, last = visible_range()
+		order = list(range(first, min(last, n))) + [i for i in range(n) if not first <= i < last]
+		for idx in order:
+			name = rows[idx]['name']
+			if name:
+				make_task(idx, name)
 
 
 	# Global buttons
-	btn_all = ttk.Button(frame, text='Lookup', command=return_all)
-	btn_all.grid(row=base_row + max_rows + 1, column=4, sticky='e', pady=(12, 0))
+	buttons_frame = ttk.Frame(frame)
+	buttons_frame.grid(row=3, column=0, columnspan=2, sticky='e', pady=(12, 0))
+	btn_all = ttk.Button(buttons_frame, text='Lookup', command=return_all)
+	btn_all.pack(side='right')
 
 	def clear_all():
+		sync_slots()
+		for r in rows[:sheet['count']]:
+			r['name'] = ''
+			reset_row(r)
+		refresh_slots()
+
+	btn_clear = ttk.Button(buttons_frame, text='Clear', command=clear_all)
+	btn_clear.pack(side='right', padx=(0, 6))
+
+	# Live game: poll the League client's local API and fill the rows with the
+	# enemy team as soon as it is known. The poller only calls back when the
+	# roster changes, so a running game doesn't keep re-running lookups.
+	def fill_roster(names):
+		if not live_var.get():
+			return
+		names = names[:max_rows]
+		ensure_rows(len(names))
+		for i, r in enumerate(rows):
+			r['name'] = names[i] if i < len(names) else ''
+		refresh_slots()
+		metrics.event('live_fill', champions=names)
+		return_all()
+
+	def on_live_roster(names):
+		# poller thread -> Tk thread
 		try:
-			n = int(rows_combo.get())
+			root.after(0, lambda: fill_roster(names))
 		except Exception:
-			n = max_rows
-		for idx in range(n):
-			rows[idx]['entry'].delete(0, tk.END)
-			put_placeholder(rows[idx]['entry'])
-			for v in rows[idx]['rvs']:
-				v.set('')
+			pass
 
-	btn_clear = ttk.Button(frame, text='Clear', command=clear_all)
-	btn_clear.grid(row=base_row + max_rows + 1, column=3, sticky='e', pady=(12, 0))
+	live_poller = LiveClientPoller(on_live_roster)
+	live_var = tk.BooleanVar(value=os.getenv('LEAGUESHEET_LIVECLIENT') == '1')
+
+	def toggle_live():
+		if live_var.get():
+			live_poller.start()
+		else:
+			live_poller.stop()
+
+	ttk.Checkbutton(controls_frame, text='Live game', variable=live_var, command=toggle_live).pack(side='left', padx=(6, 0))
+
+	# Hot start: the last session's sheet is repainted from its snapshot before
+	# any network call. Records come from the snapshot and icons from the icon
+	# store; lookups run again only if the patch (or language) has changed.
+	# LEAGUESHEET_SESSION=0 starts empty and saves nothing.
+	use_session = os.getenv('LEAGUESHEET_SESSION', '1') != '0'
+	session_file = session_path(data_dir)
+	restored = {'version': None, 'locale': None}
+
+	def save_snapshot():
+		if not use_session:
+			return
+		try:
+			sync_slots()
+			saved = [row_state(r['name'].strip(), r['shown'], r['missing'], r['icon_keys']) for r in rows]
+			while len(saved) > sheet['count'] and not saved[-1]['name']:
+				saved.pop()
+			save_session(session_file, {
+				'version': dd.dd_cache.last_good_version(),
+				'locale': dd.locale,
+				'view': view_mode_var.get(),
+				'rank': rank_var.get(),
+				'count': sheet['count'],
+				'rows': saved,
+			})
+		except Exception:
+			pass
+
+	def restore_snapshot():
+		state = load_session(session_file) if use_session else None
+		if not state:
+			return
+		icon_jobs = []
+		with metrics.span('session_restore') as sp:
+			if state.get('view') in view_options:
+				view_mode_var.set(state['view'])
+			if state.get('rank') in rank_options:
+				rank_var.set(state['rank'])
+			if state.get('locale') in LOCALES and not os.getenv('LEAGUESHEET_LOCALE'):
+				dd.set_locale(state['locale'])
+				locale_var.set(state['locale'])
+			saved = state.get('rows') or []
+			ensure_rows(len(saved))
+			for i, row in enumerate(saved):
+				model = rows[i]
+				model['name'] = row.get('name') or ''
+				try:
+					shown, keys = row_result(row)
+				except Exception:
+					shown, keys = None, []
+				model['shown'] = shown
+				model['missing'] = bool(row.get('missing'))
+				model['icon_keys'] = keys
+				if keys:
+					icon_jobs.append((i, model['gen'], keys))
+			try:
+				rows_combo.set(str(max(1, min(max_rows, int(state.get('count'))))))
+			except (TypeError, ValueError):
+				pass
+			restored['version'] = state.get('version')
+			restored['locale'] = state.get('locale')
+			sp['rows'] = len(saved)
+		if icon_jobs:
+			executor.submit(load_snapshot_icons, icon_jobs)
+
+	def load_snapshot_icons(jobs):
+		# worker: icons come from the on-disk icon store only; any that
+		# aren't there stay blank until the row is looked up again
+		for index, gen, keys in jobs:
+			decoded = decode_icons(keys, [dd.icon_store.get(*key) for key in keys])
+			root.after(0, lambda i=index, g=gen, d=decoded: apply_snapshot_icons(i, g, d))
+
+	def apply_snapshot_icons(index, gen, decoded):
+		model = rows[index]
+		if model['gen'] != gen:
+			return
+		model['decoded'] = decoded
+		paint_row(index)
+
+	def revalidate_session(version):
+		# only the first patch check after a restore matters
+		saved = restored['version']
+		if saved is None:
+			return
+		restored['version'] = None
+		if version != saved or restored['locale'] != dd.locale:
+			metrics.event('session_stale', saved=saved, version=version)
+			return_all()
+
+	restore_snapshot()
 
 	# Ensure initial visibility matches combobox
 	update_rows()
+	toggle_live()
+
+	# submit the updater but don't block startup
+	executor.submit(background_update_champion_file)
 
 	# Bind Enter to trigger the global return_all action
 	root.bind('<Return>', return_all)
 
+	# Benchmarks time startup to the first rendered frame, then close.
+	if os.getenv('LEAGUESHEET_EXIT_AFTER_START') == '1':
+		root.after_idle(lambda: root.after(0, on_close))
+
 	root.mainloop()
 
 
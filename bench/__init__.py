@@ -0,0 +1 @@
+"""Benchmarks for LeagueSheet, run against a local Data Dragon stand-in (see ddstub.py)."""
@@ -0,0 +1,325 @@
+"""Local Data Dragon stand-in server for benchmarks.
+
+Serves synthetic but realistically shaped ``versions.json``, ``champion.json``,
+``championFull.json``, per-champion JSON and icon PNGs for every name in
+``data/champions.txt``. Per-request latency, extra latency on new connections
+(to model TLS handshakes) and random failures can be injected.
+
+Run standalone to point the app at it::
+
+	python -m bench.ddstub --port 8765 --latency 40
+	set LEAGUESHEET_VERSIONS_URL=http://127.0.0.1:8765/api/versions.json
+	set LEAGUESHEET_DD_BASE=http://127.0.0.1:8765/cdn
+"""
+
+import argparse
+import collections
+import hashlib
+import http.server
+import io
+import json
+import os
+import random
+import re
+import threading
+import time
+
+from PIL import Image
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_VERSION = '14.1.1'
+
+_PATH_RE = re.compile(r'^/cdn/(?P<version>[^/]+)/(?P<rest>.+)$')
+
+
+def localize_doc(doc, locale):
+	"""Copy of a data document with its strings tagged ``[<locale>]``."""
+	def tag(text):
+		return f'[{locale}] {text}' if text else text
+
+	data = {}
+	for cid, info in doc['data'].items():
+		info = dict(info, name=tag(info.get('name')), title=tag(info.get('title')))
+		if 'spells' in info:
+			info['spells'] = [dict(s, name=tag(s.get('name')), tooltip=tag(s.get('tooltip')), description=tag(s.get('description')))
+				for s in info['spells']]
+		data[cid] = info
+	return dict(doc, data=data)
+
+
+def load_fixture_names(path=None):
+	path = path or os.path.join(REPO_ROOT, 'data', 'champions.txt')
+	with open(path, encoding='utf-8-sig') as f:
+		return [line.strip() for line in f if line.strip()]
+
+
+def _display_name(cid):
+	# a few ids whose display names differ, so name resolution is exercised
+	special = {'Kaisa': "Kai'Sa", 'DrMundo': 'Dr. Mundo', 'MonkeyKing': 'Wukong', 'Nunu': 'Nunu & Willump'}
+	return special.get(cid, cid)
+
+
+def make_champion(cid, index, version=DEFAULT_VERSION):
+	"""Full-shaped champion JSON, padded with the bulky fields real files carry."""
+	rng = random.Random(cid)
+	spells = []
+	for slot, letter in enumerate('QWER'):
+		base = rng.randint(6, 20) if slot < 3 else rng.randint(80, 160)
+		cds = [round(base - i * (base * 0.08), 1) for i in range(5 if slot < 3 else 3)]
+		cds = [int(c) if c == int(c) else c for c in cds]
+		spells.append({
+			'id': f'{cid}{letter}',
+			'name': f'{cid} {letter}',
+			'description': f'{cid} uses {letter}.',
+			# the ultimate is shaped like current patches: a named calc Data
+			# Dragon has no value for, plus the trailing modifier placeholder
+			'tooltip': ('Deals {{ totaldamage }} <magicDamage>magic damage</magicDamage>.{{ spellmodifierdescriptionappend }}' if letter == 'R'
+				else 'Deals {{ e1 }} <magicDamage>magic damage</magicDamage>.<br>Cooldown {{ cooldown }}.{{ spellmodifierdescriptionappend }}'),
+			'leveltip': {'label': ['Damage', 'Cooldown'], 'effect': ['{{ e1 }} -> {{ e1NL }}', '{{ cooldown }} -> {{ cooldownNL }}']},
+			'maxrank': len(cds),
+			'cooldown': cds,
+			'cooldownBurn': '/'.join(str(c) for c in cds),
+			'cost': [50] * len(cds),
+			'costBurn': '50',
+			'effect': [None, [40 + 25 * i for i in range(len(cds))]],
+			'effectBurn': [None, '/'.join(str(40 + 25 * i) for i in range(len(cds)))],
+			'vars': [],
+			'range': [600] * len(cds),
+			'image': {'full': f'{cid}{letter}.png', 'sprite': f'spell{index // 10}.png', 'group': 'spell',
+				'x': 48 * (index % 10), 'y': 48 * slot, 'w': 48, 'h': 48},
+		})
+	return {
+		'id': cid,
+		'key': str(1000 + index),
+		'name': _display_name(cid),
+		'title': f'the {cid}',
+		'version': version,
+		'image': {'full': f'{cid}.png', 'sprite': f'champion{index // 50}.png', 'group': 'champion',
+			'x': 48 * (index % 10), 'y': 48 * ((index % 50) // 10), 'w': 48, 'h': 48},
+		'skins': [{'id': f'{1000 + index}{n:03d}', 'num': n, 'name': f'{cid} skin {n}', 'chromas': False} for n in range(12)],
+		'lore': (f'{cid} lore. ' * 120).strip(),
+		'blurb': f'{cid} blurb.',
+		'allytips': [f'Ally tip {n} for {cid}.' for n in range(4)],
+		'enemytips': [f'Enemy tip {n} for {cid}.' for n in range(4)],
+		'tags': ['Fighter'],
+		'partype': 'Mana',
+		'info': {'attack': 5, 'defense': 5, 'magic': 5, 'difficulty': 5},
+		'stats': {k: rng.random() * 100 for k in ('hp', 'hpperlevel', 'mp', 'armor', 'attackdamage', 'attackspeed')},
+		'spells': spells,
+		'passive': {'name': f'{cid} passive', 'description': '...', 'image': {'full': f'{cid}_P.png'}},
+		'recommended': [],
+	}
+
+
+def make_png(seed, size):
+	digest = hashlib.md5(seed.encode('utf-8')).digest()
+	im = Image.new('RGBA', (size, size), (digest[0], digest[1], digest[2], 255))
+	out = io.BytesIO()
+	im.save(out, format='PNG')
+	return out.getvalue()
+
+
+class _Server(http.server.ThreadingHTTPServer):
+	# the asyncio engine opens many connections at once; the default backlog
+	# of 5 would turn that into connection resets rather than latency
+	request_queue_size = 256
+
+
+class DDragonStub:
+	"""Threaded HTTP server emulating the ddragon endpoints the app uses."""
+
+	def __init__(self, names=None, version=DEFAULT_VERSION, latency=0.0, connect_latency=0.0,
+			fail_rate=0.0, seed=0, host='127.0.0.1', port=0):
+		self.names = list(names or load_fixture_names())
+		self.version = version
+		self.latency = latency
+		self.connect_latency = connect_latency
+		self.fail_rate = fail_rate
+		self._rng = random.Random(seed)
+		self._lock = threading.Lock()
+		self.hits = collections.Counter()
+		self.connections = 0
+		self.not_modified = 0
+		self._champions = {cid: make_champion(cid, i, version) for i, cid in enumerate(self.names)}
+		self._png_cache = {}
+		self._server = _Server((host, port), self._make_handler())
+		self._server.daemon_threads = True
+		self._thread = None
+
+	# --- urls ---
+
+	@property
+	def port(self):
+		return self._server.server_address[1]
+
+	@property
+	def versions_url(self):
+		return f'http://127.0.0.1:{self.port}/api/versions.json'
+
+	@property
+	def base_url(self):
+		return f'http://127.0.0.1:{self.port}/cdn'
+
+	def env(self):
+		"""Environment variables that point LeagueSheet at this server."""
+		return {'LEAGUESHEET_VERSIONS_URL': self.versions_url, 'LEAGUESHEET_DD_BASE': self.base_url}
+
+	def start(self):
+		self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+		self._thread.start()
+		return self
+
+	def stop(self):
+		self._server.shutdown()
+		self._server.server_close()
+
+	def __enter__(self):
+		return self.start()
+
+	def __exit__(self, *exc):
+		self.stop()
+
+	def reset_counts(self):
+		with self._lock:
+			self.hits.clear()
+			self.connections = 0
+			self.not_modified = 0
+
+	def total_requests(self):
+		with self._lock:
+			return sum(self.hits.values())
+
+	def new_patch(self, version, changed=()):
+		"""Switch to ``version``; only champions in ``changed`` get new cooldowns."""
+		champions = {cid: make_champion(cid, i, version) for i, cid in enumerate(self.names)}
+		for cid in changed:
+			for spell in champions[cid]['spells']:
+				spell['cooldown'] = [c - 1 for c in spell['cooldown']]
+				spell['cooldownBurn'] = '/'.join(str(c) for c in spell['cooldown'])
+		with self._lock:
+			self.version = version
+			self._champions = champions
+			self._png_cache.clear()
+
+	# --- content ---
+
+	def route(self, path):
+		"""Return ``(content_type, body)`` for ``path`` or None for a 404."""
+		if path == '/api/versions.json':
+			return 'application/json', json.dumps([self.version, '14.0.1', '13.24.1']).encode('utf-8')
+		m = _PATH_RE.match(path)
+		if not m or m.group('version') != self.version:
+			return None
+		parts = m.group('rest').split('/')
+		if parts[0] == 'data' and len(parts) >= 3:
+			doc = self._data_doc(parts[2:])
+			if doc is None:
+				return None
+			if parts[1] != 'en_US':
+				doc = localize_doc(doc, parts[1])
+			return 'application/json', json.dumps(doc).encode('utf-8')
+		if parts[0] == 'img' and len(parts) == 3:
+			return 'image/png', self._png(parts[1], parts[2])
+		return None
+
+	def _data_doc(self, rest):
+		header = {'type': 'champion', 'format': 'standAloneComplex', 'version': self.version}
+		if rest == ['champion.json']:
+			summary = {}
+			for cid, info in self._champions.items():
+				summary[cid] = {k: info[k] for k in ('version', 'id', 'key', 'name', 'title', 'blurb', 'info', 'image', 'tags', 'partype', 'stats')}
+			return dict(header, data=summary)
+		if rest == ['championFull.json']:
+			return dict(header, format='full', data=self._champions, keys={c['key']: cid for cid, c in self._champions.items()})
+		if len(rest) == 2 and rest[0] == 'champion' and rest[1].endswith('.json'):
+			info = self._champions.get(rest[1][:-5])
+			return dict(header, data={info['id']: info}) if info else None
+		return None
+
+	def _png(self, kind, filename):
+		if kind == 'sprite':
+			size = 480
+		elif kind == 'champion':
+			size = 120
+		else:
+			size = 64
+		key = (kind, filename)
+		with self._lock:
+			png = self._png_cache.get(key)
+		if png is None:
+			png = make_png(filename, size)
+			with self._lock:
+				self._png_cache[key] = png
+		return png
+
+	def _make_handler(self):
+		stub = self
+
+		class Handler(http.server.BaseHTTPRequestHandler):
+			protocol_version = 'HTTP/1.1'
+
+			def setup(self):
+				with stub._lock:
+					stub.connections += 1
+				if stub.connect_latency:
+					time.sleep(stub.connect_latency)
+				super().setup()
+
+			def do_GET(self):
+				path = self.path.split('?', 1)[0]
+				with stub._lock:
+					stub.hits[path] += 1
+					fail = stub.fail_rate and stub._rng.random() < stub.fail_rate
+				if stub.latency:
+					time.sleep(stub.latency)
+				if fail:
+					self._send(503, 'text/plain', b'injected failure')
+					return
+				found = stub.route(path)
+				if found is None:
+					self._send(404, 'text/plain', b'not found')
+					return
+				# strong validator so clients can revalidate with If-None-Match
+				etag = '"%s"' % hashlib.sha1(found[1]).hexdigest()
+				if self.headers.get('If-None-Match') == etag:
+					with stub._lock:
+						stub.not_modified += 1
+					self._send(304, found[0], b'', etag)
+				else:
+					self._send(200, *found, etag)
+
+			def _send(self, status, content_type, body, etag=None):
+				self.send_response(status)
+				self.send_header('Content-Type', content_type)
+				if etag:
+					self.send_header('ETag', etag)
+				self.send_header('Content-Length', str(len(body)))
+				self.end_headers()
+				self.wfile.write(body)
+
+			def log_message(self, *args):
+				pass
+
+		return Handler
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description='Serve a local Data Dragon stand-in.')
+	parser.add_argument('--port', type=int, default=8765)
+	parser.add_argument('--latency', type=float, default=0.0, help='per-request latency in ms')
+	parser.add_argument('--connect-latency', type=float, default=0.0, help='extra latency per new connection in ms')
+	parser.add_argument('--fail-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+	args = parser.parse_args(argv)
+	stub = DDragonStub(latency=args.latency / 1000, connect_latency=args.connect_latency / 1000,
+		fail_rate=args.fail_rate, port=args.port).start()
+	for k, v in stub.env().items():
+		print(f'{k}={v}')
+	try:
+		threading.Event().wait()
+	except KeyboardInterrupt:
+		stub.stop()
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,118 @@
+"""Local stand-in for the League Live Client Data API.
+
+Serves a recorded game (``bench/fixtures/liveclient_game.json`` by default)
+over plain HTTP so the poller can be exercised without the game::
+
+	python -m bench.liveclient_stub --port 2999
+	set LEAGUESHEET_LIVECLIENT_URL=http://127.0.0.1:2999/liveclientdata
+
+Until a game is "started" the server refuses requests the way the real
+client does between games (connection closed without a response).
+"""
+
+import argparse
+import collections
+import http.server
+import json
+import os
+import threading
+
+from bench.ddstub import REPO_ROOT
+
+
+DEFAULT_FIXTURE = os.path.join(REPO_ROOT, 'bench', 'fixtures', 'liveclient_game.json')
+
+
+def load_game(path=None):
+	with open(path or DEFAULT_FIXTURE, encoding='utf-8') as f:
+		return json.load(f)
+
+
+class LiveClientStub:
+	"""Threaded HTTP server answering /liveclientdata/{playerlist,activeplayername}."""
+
+	def __init__(self, game=None, in_game=True, host='127.0.0.1', port=0):
+		self.game = game if game is not None else load_game()
+		self.in_game = in_game
+		self.hits = collections.Counter()
+		self._lock = threading.Lock()
+		self._server = http.server.ThreadingHTTPServer((host, port), self._make_handler())
+		self._server.daemon_threads = True
+
+	@property
+	def url(self):
+		return f'http://127.0.0.1:{self._server.server_address[1]}/liveclientdata'
+
+	def start(self):
+		threading.Thread(target=self._server.serve_forever, daemon=True).start()
+		return self
+
+	def stop(self):
+		self._server.shutdown()
+		self._server.server_close()
+
+	def __enter__(self):
+		return self.start()
+
+	def __exit__(self, *exc):
+		self.stop()
+
+	def set_game(self, game, in_game=True):
+		"""Swap in another recorded game (or ``in_game=False`` for no game)."""
+		with self._lock:
+			self.game = game
+			self.in_game = in_game
+
+	def total_requests(self):
+		with self._lock:
+			return sum(self.hits.values())
+
+	def _make_handler(self):
+		stub = self
+
+		class Handler(http.server.BaseHTTPRequestHandler):
+			protocol_version = 'HTTP/1.1'
+
+			def do_GET(self):
+				path = self.path.split('?', 1)[0].rstrip('/')
+				with stub._lock:
+					stub.hits[path] += 1
+					game, in_game = stub.game, stub.in_game
+				if not in_game:
+					# between games the real endpoint is simply not listening
+					self.close_connection = True
+					return
+				name = path.rsplit('/', 1)[-1]
+				if not path.startswith('/liveclientdata/') or name not in game:
+					self.send_error(404)
+					return
+				body = json.dumps(game[name]).encode('utf-8')
+				self.send_response(200)
+				self.send_header('Content-Type', 'application/json')
+				self.send_header('Content-Length', str(len(body)))
+				self.end_headers()
+				self.wfile.write(body)
+
+			def log_message(self, *args):
+				pass
+
+		return Handler
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description='Serve a recorded Live Client Data game.')
+	parser.add_argument('--port', type=int, default=2999)
+	parser.add_argument('--fixture', default=None, help='recorded game JSON (default: bench/fixtures/liveclient_game.json)')
+	args = parser.parse_args(argv)
+	stub = LiveClientStub(load_game(args.fixture), port=args.port).start()
+	print(f'LEAGUESHEET_LIVECLIENT_URL={stub.url}')
+	try:
+		threading.Event().wait()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		stub.stop()
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,318 @@
+"""LeagueSheet benchmark suite.
+
+Starts a local Data Dragon stand-in (:mod:`bench.ddstub`), points the data
+layer at it and measures:
+
+- cold / warm lookup latency for 1-5 rows (JSON plus all five icons per row)
+- full-roster prefetch (champion bundle build)
+- fetch engines: threads vs asyncio for a per-champion roster fan-out and
+  cold 5-row lookups
+- memory per cached champion: full JSON vs parsed ChampionRecord
+- autocomplete latency per keystroke over the champion list
+- process startup (data-layer import, and the GUI when a display is available)
+
+Results are written as JSON so runs can be compared::
+
+	python -m bench.run --latency 30 --output before.json
+	python -m bench.run --latency 30 --output after.json --compare before.json
+"""
+
+import argparse
+import concurrent.futures
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bench.ddstub import REPO_ROOT, DDragonStub, load_fixture_names, make_champion
+from leaguesheet.autocomplete import ChampionIndex
+from leaguesheet.ddragon import SLOTS, DataDragon
+from leaguesheet.engines import ENGINES, make_engine
+from leaguesheet.pipeline import Scheduler
+from leaguesheet.records import ChampionRecord
+
+
+SAMPLE_ROWS = ['Ahri', "kai'sa", 'mundo', 'Zed', 'wukong']
+SAMPLE_QUERIES = ['Ahri', 'Kaisa', 'Mundo', 'Yasuo', 'Twisted Fate', 'tf', 'yassuo', 'Nunu']
+
+
+def summarize(samples, requests=None):
+	ms = sorted(s * 1000 for s in samples)
+	out = {
+		'runs': len(ms),
+		'median_ms': round(statistics.median(ms), 3),
+		'min_ms': round(ms[0], 3),
+		'p95_ms': round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 3),
+	}
+	if requests is not None:
+		out['requests'] = requests
+	return out
+
+
+def lookup_rows(dd, scheduler, names):
+	"""Headless equivalent of the GUI's Lookup: JSON, then every icon at once."""
+	def resolve(name):
+		resolver, version, _ = dd.load_champion_key_map()
+		key = resolver.resolve(name)
+		return version, dd.champion_data(key, version)
+
+	def icons(resolved):
+		version, data = resolved
+		jobs = [scheduler.submit(dd.icon_png, 'champion', version, data.image.full, None, 5, data.image)]
+		for spell in data.spells[:len(SLOTS)]:
+			jobs.append(scheduler.submit(dd.icon_png, 'spell', version, spell.image.full, None, 5, spell.image))
+		return scheduler.when_all(jobs)
+
+	futs = [scheduler.then(scheduler.submit(resolve, n), icons) for n in names]
+	for f in futs:
+		for job in f.result():
+			job.result()
+
+
+class Bench:
+	def __init__(self, stub, repeat, workers):
+		self.stub = stub
+		self.repeat = repeat
+		self.workers = workers
+		self.results = {}
+		self._dirs = []
+
+	def new_data_dir(self):
+		path = tempfile.mkdtemp(prefix='leaguesheet-bench-')
+		self._dirs.append(path)
+		return path
+
+	def cleanup(self):
+		for path in self._dirs:
+			shutil.rmtree(path, ignore_errors=True)
+
+	def data_dragon(self, data_dir, sprites=True):
+		return DataDragon(data_dir=data_dir, max_workers=self.workers, offline=False,
+			versions_url=self.stub.versions_url, base_url=self.stub.base_url, sprites=sprites)
+
+	def record(self, name, samples, requests=None):
+		self.results[name] = summarize(samples, requests)
+		r = self.results[name]
+		extra = f", {requests} requests" if requests is not None else ''
+		print(f"{name:32s} median {r['median_ms']:9.2f} ms  p95 {r['p95_ms']:9.2f} ms{extra}", file=sys.stderr)
+
+	def bench_lookups(self):
+		with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+			scheduler = Scheduler(pool)
+			for n in range(1, len(SAMPLE_ROWS) + 1):
+				names = SAMPLE_ROWS[:n]
+				cold, warm_disk, warm_mem = [], [], []
+				cold_requests = 0
+				for _ in range(self.repeat):
+					data_dir = self.new_data_dir()
+					dd = self.data_dragon(data_dir)
+					self.stub.reset_counts()
+					start = time.perf_counter()
+					lookup_rows(dd, scheduler, names)
+					cold.append(time.perf_counter() - start)
+					cold_requests = self.stub.total_requests()
+					# same process, everything memoized
+					start = time.perf_counter()
+					lookup_rows(dd, scheduler, names)
+					warm_mem.append(time.perf_counter() - start)
+					dd.close()
+					# fresh client on the same data dir: a warm restart
+					dd = self.data_dragon(data_dir)
+					self.stub.reset_counts()
+					start = time.perf_counter()
+					lookup_rows(dd, scheduler, names)
+					warm_disk.append(time.perf_counter() - start)
+					warm_requests = self.stub.total_requests()
+					dd.close()
+				self.record(f'lookup_cold_{n}_rows', cold, cold_requests)
+				self.record(f'lookup_warm_disk_{n}_rows', warm_disk, warm_requests)
+				self.record(f'lookup_warm_memory_{n}_rows', warm_mem)
+			# same full sheet with one download per icon instead of sprite sheets
+			samples = []
+			for _ in range(self.repeat):
+				dd = self.data_dragon(self.new_data_dir(), sprites=False)
+				self.stub.reset_counts()
+				start = time.perf_counter()
+				lookup_rows(dd, scheduler, SAMPLE_ROWS)
+				samples.append(time.perf_counter() - start)
+				requests = self.stub.total_requests()
+				dd.close()
+			self.record(f'lookup_cold_{len(SAMPLE_ROWS)}_rows_single_icons', samples, requests)
+
+	def bench_prefetch(self):
+		samples = []
+		requests = 0
+		with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+			for _ in range(self.repeat):
+				dd = self.data_dragon(self.new_data_dir())
+				self.stub.reset_counts()
+				start = time.perf_counter()
+				dd.ensure_champion_db(executor=pool)
+				samples.append(time.perf_counter() - start)
+				requests = self.stub.total_requests()
+				dd.close()
+		self.record('roster_prefetch', samples, requests)
+
+	def bench_engines(self):
+		for kind in ENGINES:
+			fanout, rows = [], []
+			fanout_requests = row_requests = 0
+			with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+				for _ in range(self.repeat):
+					dd = self.data_dragon(self.new_data_dir())
+					engine = make_engine(kind, dd, pool)
+					self.stub.reset_counts()
+					start = time.perf_counter()
+					engine.lookup_row(SAMPLE_ROWS[0]).result()
+					futs = [engine.lookup_row(n) for n in SAMPLE_ROWS]
+					for f in futs:
+						f.result()
+					rows.append(time.perf_counter() - start)
+					row_requests = self.stub.total_requests()
+					# whole roster, one request per champion
+					self.stub.reset_counts()
+					start = time.perf_counter()
+					engine.prefetch_roster().result()
+					fanout.append(time.perf_counter() - start)
+					fanout_requests = self.stub.total_requests()
+					engine.close()
+					dd.close()
+			self.record(f'engine_{kind}_lookup_cold_5_rows', rows, row_requests)
+			self.record(f'engine_{kind}_roster_fanout', fanout, fanout_requests)
+
+	def bench_memory(self):
+		names = load_fixture_names()
+		payloads = [json.dumps(make_champion(cid, i)) for i, cid in enumerate(names)]
+
+		def retained(build):
+			# bytes still allocated after building the whole roster
+			tracemalloc.start()
+			before = tracemalloc.get_traced_memory()[0]
+			held = [build(p) for p in payloads]
+			after = tracemalloc.get_traced_memory()[0]
+			tracemalloc.stop()
+			del held
+			return (after - before) // len(payloads)
+
+		for name, build in (
+			('memory_champion_json', json.loads),
+			('memory_champion_record', lambda p: ChampionRecord.from_ddragon(json.loads(p))),
+		):
+			size = retained(build)
+			self.results[name] = {'bytes_per_champion': size, 'champions': len(payloads)}
+			print(f"{name:32s} {size:9d} bytes per champion", file=sys.stderr)
+
+	def bench_autocomplete(self):
+		names = load_fixture_names()
+		start = time.perf_counter()
+		index = ChampionIndex(names)
+		self.record('autocomplete_index_build', [time.perf_counter() - start])
+		samples = []
+		for _ in range(self.repeat):
+			for query in SAMPLE_QUERIES:
+				for i in range(1, len(query) + 1):
+					start = time.perf_counter()
+					index.search(query[:i], limit=40)
+					samples.append(time.perf_counter() - start)
+		self.record('autocomplete_keystroke', samples)
+
+	def bench_startup(self):
+		env = dict(os.environ, **self.stub.env())
+		samples = []
+		for _ in range(self.repeat):
+			start = time.perf_counter()
+			subprocess.run([sys.executable, '-c', 'import leaguesheet.ddragon'], cwd=REPO_ROOT, env=env, check=True)
+			samples.append(time.perf_counter() - start)
+		self.record('startup_import', samples)
+		if os.name != 'nt' and not os.getenv('DISPLAY'):
+			print('startup_gui                      skipped (no display)', file=sys.stderr)
+			return
+		samples = []
+		# a throwaway data dir, so the stub's patch, champion list and session
+		# never end up in the user's real one
+		with tempfile.TemporaryDirectory() as data_home:
+			gui_env = dict(env, LEAGUESHEET_EXIT_AFTER_START='1', LEAGUESHEET_OFFLINE='0', LEAGUESHEET_SESSION='0',
+				XDG_DATA_HOME=data_home, LOCALAPPDATA=data_home)
+			for _ in range(self.repeat):
+				start = time.perf_counter()
+				subprocess.run([sys.executable, os.path.join(REPO_ROOT, 'LeagueSheet.py')], cwd=REPO_ROOT, env=gui_env, check=True, timeout=60)
+				samples.append(time.perf_counter() - start)
+		self.record('startup_gui', samples)
+
+
+def compare(results, baseline_path, threshold):
+	"""Print median deltas against a previous run; return True if anything regressed."""
+	with open(baseline_path, encoding='utf-8') as f:
+		baseline = json.load(f)['results']
+	regressed = False
+	print(f'\ncompared with {baseline_path} (regression threshold {threshold:.0%}):', file=sys.stderr)
+	for name, cur in results.items():
+		old = baseline.get(name)
+		metric, unit = ('median_ms', 'ms') if 'median_ms' in cur else ('bytes_per_champion', 'B')
+		if not old or not old.get(metric):
+			continue
+		ratio = cur[metric] / old[metric]
+		flag = ''
+		if ratio > 1 + threshold:
+			flag = '  REGRESSION'
+			regressed = True
+		print(f"{name:32s} {old[metric]:9.2f} -> {cur[metric]:9.2f} {unit} ({ratio - 1:+.0%}){flag}", file=sys.stderr)
+	return regressed
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description='Benchmark LeagueSheet against a local Data Dragon stand-in.')
+	parser.add_argument('--latency', type=float, default=20.0, help='per-request latency in ms (default 20)')
+	parser.add_argument('--connect-latency', type=float, default=30.0, help='extra latency per new connection in ms (default 30)')
+	parser.add_argument('--fail-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+	parser.add_argument('--repeat', type=int, default=3)
+	parser.add_argument('--workers', type=int, default=16)
+	parser.add_argument('--only', action='append', choices=('lookups', 'prefetch', 'engines', 'memory', 'autocomplete', 'startup'))
+	parser.add_argument('--output', default=None, help='results file (default bench/results/<timestamp>.json)')
+	parser.add_argument('--compare', default=None, help='previous results file to compare against')
+	parser.add_argument('--threshold', type=float, default=0.10, help='relative slowdown treated as a regression')
+	args = parser.parse_args(argv)
+
+	stub = DDragonStub(latency=args.latency / 1000, connect_latency=args.connect_latency / 1000, fail_rate=args.fail_rate)
+	bench = Bench(stub.start(), args.repeat, args.workers)
+	suites = args.only or ['lookups', 'prefetch', 'engines', 'memory', 'autocomplete', 'startup']
+	try:
+		for suite in suites:
+			getattr(bench, f'bench_{suite}')()
+	finally:
+		stub.stop()
+		bench.cleanup()
+
+	stamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+	output = args.output or os.path.join(REPO_ROOT, 'bench', 'results', f'{stamp}.json')
+	os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+	doc = {
+		'meta': {
+			'timestamp': stamp,
+			'python': platform.python_version(),
+			'platform': platform.platform(),
+			'latency_ms': args.latency,
+			'connect_latency_ms': args.connect_latency,
+			'fail_rate': args.fail_rate,
+			'repeat': args.repeat,
+			'workers': args.workers,
+		},
+		'results': bench.results,
+	}
+	with open(output, 'w', encoding='utf-8') as f:
+		json.dump(doc, f, indent=2)
+	print(f'\nresults written to {output}', file=sys.stderr)
+	if args.compare and compare(bench.results, args.compare, args.threshold):
+		return 1
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
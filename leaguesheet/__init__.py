@@ -0,0 +1 @@
+"""Support modules for the LeagueSheet app (Data Dragon caching and helpers)."""
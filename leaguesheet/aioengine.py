@@ -0,0 +1,308 @@
+"""Asyncio fetch engine on a dedicated event-loop thread.
+
+One event loop runs on a daemon thread and owns every network request. Fetches
+are coroutines, so hundreds of icon and champion requests can be in flight at
+once without a thread each; the connector's limits bound how many. Callers
+on other threads (the Tk thread, the CLI) get ``concurrent.futures.Future``
+objects back and marshal results however they like - the GUI hops back onto
+the Tk thread through ``root.after``.
+
+HTTP goes through one pooled ``aiohttp`` session (keep-alive, redirects,
+proxies from the environment) with per-request timeouts and jittered retries.
+Cache and database reads, JSON parsing and image work run on the default
+executor, never on the loop. Caches are the same ones the thread engine uses,
+so either engine warms them.
+"""
+
+import asyncio
+import json
+import random
+import threading
+
+import aiohttp
+
+from . import metrics
+from .engines import icon_specs
+from .fetch import RETRY_STATUSES
+from .iconcache import resize_png
+from .records import ChampionRecord, champion_text
+from .sprites import has_sprite
+
+
+class HttpStatusError(Exception):
+	"""Non-success HTTP status from :class:`AsyncHttpClient`."""
+
+	def __init__(self, status, url):
+		super().__init__(f'{status} for {url}')
+		self.status = status
+		self.url = url
+
+
+class _Retryable(Exception):
+	pass
+
+
+class AsyncHttpClient:
+	"""Pooled ``aiohttp`` GET client for one event loop."""
+
+	def __init__(self, max_concurrency=256, per_host=64, retries=3, backoff=0.25, max_backoff=4.0,
+			timeout=5, user_agent='LeagueSheet'):
+		self.max_concurrency = max_concurrency
+		self.per_host = per_host
+		self.retries = retries
+		self.backoff = backoff
+		self.max_backoff = max_backoff
+		self.timeout = timeout
+		self.user_agent = user_agent
+		# created lazily so it binds to the loop that runs the requests
+		self._session = None
+
+	def _get_session(self):
+		if self._session is None:
+			connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.per_host)
+			# trust_env: HTTP(S)_PROXY / NO_PROXY, the same as requests
+			self._session = aiohttp.ClientSession(connector=connector, headers={'User-Agent': self.user_agent}, trust_env=True)
+		return self._session
+
+	async def _sleep_before_retry(self, attempt, headers=None):
+		delay = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+		retry_after = (headers or {}).get('Retry-After', '')
+		if retry_after.isdigit():
+			delay = min(self.max_backoff, max(delay, int(retry_after)))
+		await asyncio.sleep(delay)
+
+	async def get(self, url, timeout=None):
+		"""GET ``url`` and return ``(status, headers, body)``; raises once retries are exhausted."""
+		session = self._get_session()
+		client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+		attempt = 0
+		while True:
+			headers = None
+			start = metrics.begin()
+			status = None
+			try:
+				async with session.get(url, timeout=client_timeout) as resp:
+					status = resp.status
+					headers = resp.headers
+					if status in RETRY_STATUSES:
+						raise _Retryable(status)
+					if status >= 400:
+						raise HttpStatusError(status, url)
+					return status, headers, await resp.read()
+			except (aiohttp.ClientError, asyncio.TimeoutError, _Retryable):
+				metrics.count('http.retry' if attempt < self.retries else 'http.failed')
+				if attempt >= self.retries:
+					if status is not None:
+						raise HttpStatusError(status, url) from None
+					raise
+			finally:
+				metrics.end('http_get', start, url=url, attempt=attempt, status=status, engine='asyncio')
+			await self._sleep_before_retry(attempt, headers)
+			attempt += 1
+
+	async def get_bytes(self, url, timeout=None):
+		return (await self.get(url, timeout=timeout))[2]
+
+	async def get_json(self, url, timeout=None):
+		body = await self.get_bytes(url, timeout=timeout)
+		# large documents: parse off the loop
+		return await asyncio.get_running_loop().run_in_executor(None, json.loads, body)
+
+	async def close(self):
+		if self._session is not None:
+			await self._session.close()
+			self._session = None
+
+
+class AsyncEngine:
+	"""Row lookups and roster prefetches as coroutines on a background loop."""
+
+	name = 'asyncio'
+
+	def __init__(self, dd, max_concurrency=256, timeout=5):
+		self.dd = dd
+		self.timeout = timeout
+		self.http = AsyncHttpClient(max_concurrency=max_concurrency, timeout=timeout)
+		self.loop = asyncio.new_event_loop()
+		self._inflight = {}
+		# parsed records by (key, version); compact enough to hold the roster
+		self._records = {}
+		# display-locale strings by (key, version, locale)
+		self._texts = {}
+		self._thread = threading.Thread(target=self._run, name='leaguesheet-aio', daemon=True)
+		self._thread.start()
+
+	def _run(self):
+		asyncio.set_event_loop(self.loop)
+		self.loop.run_forever()
+
+	def submit(self, coro):
+		"""Schedule ``coro`` on the engine loop; cancelling the returned future cancels it."""
+		return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+	def _blocking(self, fn, *args):
+		# disk and database access, parsing and resizing stay off the loop
+		return self.loop.run_in_executor(None, fn, *args)
+
+	async def _once(self, key, factory):
+		# coroutine-level single flight: concurrent waiters share one task
+		task = self._inflight.get(key)
+		if task is None:
+			task = self.loop.create_task(factory())
+			self._inflight[key] = task
+			task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+		else:
+			metrics.count('aio.coalesced.shared')
+		# shield so one cancelled row doesn't cancel the fetch other rows share
+		return await asyncio.shield(task)
+
+	async def _key_map(self, version=None):
+		# memoized on the DataDragon instance; only the first call blocks a worker
+		return await self._blocking(self.dd.load_champion_key_map, version)
+
+	async def _champion_data(self, key, version):
+		dd = self.dd
+		db = await self._blocking(dd.current_db, version)
+		if db is not None:
+			data = await self._blocking(db.champion_data, key)
+			if data is not None:
+				return data
+		record = self._records.get((key, version))
+		if record is not None:
+			return record
+		name = f'champion/{key}'
+		doc = await self._blocking(dd.dd_cache.get, version, dd.data_locale, name)
+		if doc is None:
+			if dd.offline:
+				raise LookupError(f'{version}/{dd.data_locale}/{name} not cached (offline)')
+
+			async def fetch():
+				url = f'{dd.base_url}/{version}/data/{dd.data_locale}/champion/{key}.json'
+				fetched = await self.http.get_json(url)
+				await self._blocking(dd.dd_cache.put, version, dd.data_locale, name, fetched)
+				return fetched
+			doc = await self._once(('champion', key, version), fetch)
+		record = self._records[(key, version)] = await self._blocking(ChampionRecord.from_ddragon, doc['data'][key])
+		return record
+
+	def _cached_text(self, key, version, locale):
+		cache = self.dd.dd_cache
+		# a dragontail archive imported for this locale has the full document
+		full = cache.get(version, locale, f'champion/{key}')
+		if full is not None:
+			return champion_text(full['data'][key])
+		return cache.get(version, locale, f'text/{key}')
+
+	async def _localized(self, record, version):
+		# only the strings are fetched per locale; numbers and images are shared
+		dd = self.dd
+		locale = dd.locale
+		if locale == dd.data_locale:
+			return record
+		key = record.key
+		name = f'text/{key}'
+		text = self._texts.get((key, version, locale))
+		if text is None:
+			text = await self._blocking(self._cached_text, key, version, locale)
+		if text is None:
+			if dd.offline:
+				return record
+
+			async def fetch():
+				doc = await self.http.get_json(f'{dd.base_url}/{version}/data/{locale}/champion/{key}.json')
+				fetched = champion_text(doc['data'][key])
+				await self._blocking(dd.dd_cache.put, version, locale, name, fetched)
+				return fetched
+			try:
+				text = await self._once(('text', key, version, locale), fetch)
+			except asyncio.CancelledError:
+				raise
+			except Exception:
+				metrics.count('locale.fallback')
+				return record
+		self._texts[(key, version, locale)] = text
+		return record.with_text(text, locale)
+
+	async def _sprite_sheet(self, version, sprite):
+		# download each sheet once; decoding happens on first render
+		sheets = self.dd.sprites
+		if await self._blocking(sheets.available, version, sprite):
+			return
+
+		async def fetch():
+			raw = await self.http.get_bytes(self.dd.sprite_url(version, sprite))
+			await self._blocking(sheets.store, version, sprite, raw)
+
+		await self._once(('sprite', version, sprite), fetch)
+
+	async def _icon(self, kind, version, image, size):
+		img_full = image.full
+		if not img_full:
+			return None
+		store = self.dd.icon_store
+		name = f'{kind}/{img_full}'
+		png = await self._blocking(store.get, version, name, size)
+		if png is not None:
+			return png
+
+		async def fetch():
+			if self.dd.use_sprites and has_sprite(image):
+				await self._sprite_sheet(version, image.sprite)
+				out = await self._blocking(self.dd.sprites.render, version, image, size)
+			else:
+				raw = await self.http.get_bytes(f'{self.dd.base_url}/{version}/img/{kind}/{img_full}')
+				out = await self._blocking(resize_png, raw, size)
+			await self._blocking(store.put, version, name, size, out)
+			return out
+
+		try:
+			return await self._once(('icon', version, name, size), fetch)
+		except asyncio.CancelledError:
+			raise
+		except Exception:
+			return None
+
+	async def _lookup_row(self, name, is_current):
+		resolver, version, _ = await self._key_map()
+		with metrics.span('resolve', name=name):
+			champ_key = resolver.resolve(name)
+		if not champ_key:
+			return None
+		data = await self._localized(await self._champion_data(champ_key, version), version)
+		if is_current and not is_current():
+			return None
+		icons = await asyncio.gather(*(self._icon(kind, version, img, size) for kind, img, size in icon_specs(data)))
+		return {'version': version, 'key': champ_key, 'data': data, 'icons': list(icons)}
+
+	def lookup_row(self, name, is_current=None):
+		return self.submit(self._lookup_row(name, is_current))
+
+	async def _prefetch_roster(self, version):
+		resolver, version, _ = await self._key_map(version)
+		keys = sorted(resolver.keys())
+		await asyncio.gather(*(self._champion_data(k, version) for k in keys))
+		return len(keys)
+
+	def prefetch_roster(self, version=None):
+		"""Fetch every champion's JSON concurrently into the cache."""
+		return self.submit(self._prefetch_roster(version))
+
+	def close(self):
+		if not self.loop.is_running():
+			return
+
+		async def shutdown():
+			tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+			for task in tasks:
+				task.cancel()
+			await asyncio.gather(*tasks, return_exceptions=True)
+			await self.http.close()
+
+		try:
+			self.submit(shutdown()).result(timeout=2)
+		except Exception:
+			pass
+		self.loop.call_soon_threadsafe(self.loop.stop)
+		self._thread.join(timeout=2)
+		if not self._thread.is_alive():
+			self.loop.close()
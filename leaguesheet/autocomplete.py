@@ -0,0 +1,110 @@
+"""Precomputed champion search index for the autocomplete dropdown.
+
+Names are normalized once and kept sorted so a prefix query is a bisect plus
+a short scan. Queries that match no prefix fall back to substring,
+subsequence and trigram-overlap matching, ranked best first.
+"""
+
+import bisect
+
+from .names import normalize_name
+
+
+def _trigrams(text):
+	padded = f'  {text} '
+	return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _subsequence_span(query, target):
+	# length of the shortest-from-first-hit window of target containing query
+	# as a subsequence, or None if it is not a subsequence
+	pos = start = -1
+	for ch in query:
+		pos = target.find(ch, pos + 1)
+		if pos < 0:
+			return None
+		if start < 0:
+			start = pos
+	return pos - start + 1
+
+
+class ChampionIndex:
+	"""Search index over champion display names (plus optional aliases)."""
+
+	def __init__(self, names, aliases=None, min_trigram_score=0.4):
+		self.names = list(names)
+		self.min_trigram_score = min_trigram_score
+		# (normalized form, name index) pairs; aliases point at the same name
+		forms = {}
+		for i, name in enumerate(self.names):
+			forms.setdefault(normalize_name(name), i)
+		index_of = {name: i for i, name in enumerate(self.names)}
+		for alias, name in (aliases or {}).items():
+			if name in index_of:
+				forms.setdefault(normalize_name(alias), index_of[name])
+		forms.pop('', None)
+		self._keys = sorted(forms)
+		self._targets = [forms[k] for k in self._keys]
+		self._trigram_map = {}
+		for pos, key in enumerate(self._keys):
+			for tg in _trigrams(key):
+				self._trigram_map.setdefault(tg, []).append(pos)
+
+	def __len__(self):
+		return len(self.names)
+
+	def prefix(self, query):
+		"""Names whose normalized form (or an alias) starts with ``query``."""
+		q = normalize_name(query)
+		lo = bisect.bisect_left(self._keys, q)
+		hi = bisect.bisect_left(self._keys, q + '\uffff', lo)
+		seen = set()
+		out = []
+		for pos in range(lo, hi):
+			i = self._targets[pos]
+			if i not in seen:
+				seen.add(i)
+				out.append(i)
+		out.sort(key=lambda i: self.names[i].lower())
+		return [self.names[i] for i in out]
+
+	def search(self, query, limit=None):
+		"""Ranked matches: prefix, then substring, then fuzzy."""
+		q = normalize_name(query)
+		if not q:
+			return self.names[:limit] if limit else list(self.names)
+		results = self.prefix(q)
+		if limit and len(results) >= limit:
+			return results[:limit]
+		seen = set(results)
+		scored = []
+		for pos, key in enumerate(self._keys):
+			name = self.names[self._targets[pos]]
+			if name in seen:
+				continue
+			at = key.find(q)
+			if at >= 0:
+				scored.append((0, at, len(key), name))
+				continue
+			span = _subsequence_span(q, key)
+			if span is not None and len(q) > 1:
+				scored.append((1, span - len(q), len(key), name))
+		if len(q) >= 3:
+			# typo tolerance: rank by the share of the query's trigrams present
+			qgrams = _trigrams(q)
+			hits = {}
+			for tg in qgrams:
+				for pos in self._trigram_map.get(tg, ()):
+					hits[pos] = hits.get(pos, 0) + 1
+			for pos, n in hits.items():
+				score = n / len(qgrams)
+				if score >= self.min_trigram_score:
+					scored.append((2, -score, len(self._keys[pos]), self.names[self._targets[pos]]))
+		scored.sort()
+		for _tier, _a, _b, name in scored:
+			if name not in seen:
+				seen.add(name)
+				results.append(name)
+				if limit and len(results) >= limit:
+					break
+		return results
@@ -0,0 +1,108 @@
+"""Streaming ingest of Data Dragon's ``championFull.json``.
+
+The whole roster comes down in one request. The document is parsed
+incrementally, one champion object at a time, and each champion is trimmed to
+the fields the app reads before the next is decoded, so memory stays at
+roughly one chunk plus one champion no matter how large the file grows.
+"""
+
+import codecs
+import json
+
+
+# fields kept per champion / per spell; everything else (lore, skins, tips,
+# recommended items, stats...) is dropped as soon as the object is parsed
+CHAMPION_FIELDS = ('id', 'key', 'name', 'title', 'image', 'spells')
+SPELL_FIELDS = (
+	'id', 'name', 'description', 'tooltip', 'maxrank', 'cooldown', 'cooldownBurn',
+	'effect', 'effectBurn', 'vars', 'image',
+)
+
+_WS = ' \t\r\n'
+
+
+def slim_champion(info):
+	out = {k: info[k] for k in CHAMPION_FIELDS if k in info}
+	out['spells'] = [{k: s[k] for k in SPELL_FIELDS if k in s} for s in info.get('spells', [])]
+	return out
+
+
+class _Stream:
+	"""Incremental text buffer over an iterator of byte chunks."""
+
+	def __init__(self, chunks):
+		self._chunks = iter(chunks)
+		self._decoder = codecs.getincrementaldecoder('utf-8')()
+		self._json = json.JSONDecoder()
+		self.buf = ''
+		self.pos = 0
+		self.eof = False
+
+	def _fill(self):
+		if self.eof:
+			return False
+		try:
+			chunk = next(self._chunks)
+		except StopIteration:
+			self.buf += self._decoder.decode(b'', final=True)
+			self.eof = True
+			return True
+		# drop what has already been consumed before growing the buffer
+		self.buf = self.buf[self.pos:] + self._decoder.decode(chunk)
+		self.pos = 0
+		return True
+
+	def peek(self):
+		# next non-whitespace character, or '' at end of stream
+		while True:
+			while self.pos < len(self.buf) and self.buf[self.pos] in _WS:
+				self.pos += 1
+			if self.pos < len(self.buf):
+				return self.buf[self.pos]
+			if not self._fill():
+				return ''
+
+	def expect(self, ch):
+		if self.peek() != ch:
+			raise ValueError(f'expected {ch!r} at offset {self.pos}')
+		self.pos += 1
+
+	def value(self):
+		"""Decode the next complete JSON value, reading more input as needed."""
+		self.peek()
+		while True:
+			try:
+				val, end = self._json.raw_decode(self.buf, self.pos)
+			except json.JSONDecodeError:
+				if not self._fill():
+					raise
+				continue
+			# a number at the very end of the buffer may still be incomplete
+			if end == len(self.buf) and not self.eof and not isinstance(val, (dict, list, str)):
+				self._fill()
+				continue
+			self.pos = end
+			return val
+
+
+def iter_champions_full(chunks):
+	"""Yield ``(key, slim_info)`` pairs from a championFull.json byte stream."""
+	st = _Stream(chunks)
+	st.expect('{')
+	while st.peek() != '}':
+		name = st.value()
+		st.expect(':')
+		if name != 'data':
+			st.value()
+		else:
+			st.expect('{')
+			while st.peek() != '}':
+				key = st.value()
+				st.expect(':')
+				yield key, slim_champion(st.value())
+				if st.peek() == ',':
+					st.pos += 1
+			st.expect('}')
+		if st.peek() == ',':
+			st.pos += 1
+	st.expect('}')
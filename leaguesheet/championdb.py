@@ -0,0 +1,199 @@
+"""Indexed SQLite "patch bundle" holding the champion fields the app uses.
+
+One database file is built per Data Dragon version and locale. It is written
+to a temp file and renamed into place once complete, so readers only ever
+open a finished bundle. Lookups are primary-key or index range reads.
+"""
+
+import json
+import os
+import pathlib
+import sqlite3
+import tempfile
+import threading
+
+from .records import ChampionRecord
+
+
+SCHEMA = """
+CREATE TABLE meta (
+	version TEXT NOT NULL,
+	locale TEXT NOT NULL
+);
+CREATE TABLE champions (
+	key TEXT PRIMARY KEY,
+	id TEXT NOT NULL,
+	name TEXT NOT NULL,
+	title TEXT,
+	image TEXT
+);
+CREATE TABLE spells (
+	key TEXT NOT NULL,
+	slot INTEGER NOT NULL,
+	name TEXT,
+	cooldown TEXT,
+	cooldown_burn TEXT,
+	tooltip TEXT,
+	description TEXT,
+	image TEXT,
+	effect TEXT,
+	effect_burn TEXT,
+	vars TEXT,
+	PRIMARY KEY (key, slot)
+) WITHOUT ROWID;
+CREATE INDEX champions_name ON champions (name COLLATE NOCASE);
+"""
+
+
+# bumped when the schema changes; older bundles are simply rebuilt
+BUNDLE_FORMAT = 2
+
+
+def bundle_path(root, version, locale):
+	return os.path.join(root, f'{version}-{locale}.v{BUNDLE_FORMAT}.sqlite3')
+
+
+# image fields kept per champion/spell: file name plus sprite atlas coordinates
+IMAGE_FIELDS = ('full', 'sprite', 'x', 'y', 'w', 'h')
+
+
+def _image_text(image):
+	image = image or {}
+	return json.dumps({k: image[k] for k in IMAGE_FIELDS if k in image}, separators=(',', ':'))
+
+
+def _image(text):
+	return json.loads(text) if text else {}
+
+
+def build_bundle(path, version, locale, champions):
+	"""Write a bundle from an iterable of per-champion Data Dragon dicts."""
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	# a unique temp file, so a concurrent build (another process, say) never
+	# writes into or deletes this one
+	fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp')
+	os.close(fd)
+	try:
+		conn = sqlite3.connect(tmp)
+		try:
+			conn.executescript(SCHEMA)
+			conn.execute('INSERT INTO meta VALUES (?, ?)', (version, locale))
+			for info in champions:
+				key = info['id']
+				conn.execute(
+					'INSERT OR REPLACE INTO champions VALUES (?, ?, ?, ?, ?)',
+					(key, info['id'], info.get('name') or key, info.get('title'), _image_text(info.get('image'))),
+				)
+				for slot, spell in enumerate(info.get('spells', [])):
+					conn.execute(
+						'INSERT OR REPLACE INTO spells VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+						(
+							key, slot, spell.get('name'),
+							json.dumps(spell.get('cooldown') or []),
+							spell.get('cooldownBurn'),
+							spell.get('tooltip'),
+							spell.get('description'),
+							_image_text(spell.get('image')),
+							json.dumps(spell.get('effect') or []),
+							json.dumps(spell.get('effectBurn') or []),
+							json.dumps(spell.get('vars') or []),
+						),
+					)
+			conn.commit()
+		finally:
+			conn.close()
+		os.replace(tmp, path)
+	except BaseException:
+		try:
+			os.remove(tmp)
+		except OSError:
+			pass
+		raise
+
+
+def remove_stale_bundles(root, keep_path):
+	# drop bundles for older patches once a new one is in place
+	try:
+		names = os.listdir(root)
+	except OSError:
+		return
+	for fn in names:
+		path = os.path.join(root, fn)
+		if fn.endswith('.sqlite3') and os.path.abspath(path) != os.path.abspath(keep_path):
+			try:
+				os.remove(path)
+			except OSError:
+				pass
+
+
+class ChampionDB:
+	"""Read-only access to a built bundle; one connection per thread."""
+
+	def __init__(self, path):
+		self.path = path
+		self._local = threading.local()
+		meta = self._conn().execute('SELECT version, locale FROM meta').fetchone()
+		if meta is None:
+			# not a finished bundle
+			raise sqlite3.DatabaseError(f'{path}: no meta row')
+		self.version, self.locale = meta
+
+	@classmethod
+	def open(cls, path):
+		"""Open ``path`` if a finished bundle exists there, else return None."""
+		if not os.path.exists(path):
+			return None
+		try:
+			return cls(path)
+		except sqlite3.Error:
+			return None
+
+	def _conn(self):
+		conn = getattr(self._local, 'conn', None)
+		if conn is None:
+			uri = pathlib.Path(os.path.abspath(self.path)).as_uri() + '?mode=ro'
+			conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+			self._local.conn = conn
+		return conn
+
+	def names(self):
+		rows = self._conn().execute('SELECT id FROM champions ORDER BY id COLLATE NOCASE')
+		return [r[0] for r in rows]
+
+	def display_names(self):
+		"""Map display name -> champion id (e.g. "Kai'Sa" -> "Kaisa")."""
+		return dict(self._conn().execute('SELECT name, id FROM champions'))
+
+	def champions(self):
+		"""``(key, display name)`` for every champion."""
+		return self._conn().execute('SELECT key, name FROM champions').fetchall()
+
+	def cooldowns(self):
+		"""``(key, slot, per-rank cooldowns)`` for every spell in the bundle."""
+		rows = self._conn().execute('SELECT key, slot, cooldown FROM spells')
+		return [(key, slot, json.loads(cd or '[]')) for key, slot, cd in rows]
+
+	def champion_data(self, key):
+		"""Return the champion as a :class:`~leaguesheet.records.ChampionRecord`."""
+		conn = self._conn()
+		row = conn.execute('SELECT id, name, title, image FROM champions WHERE key = ?', (key,)).fetchone()
+		if not row:
+			return None
+		spells = []
+		for name, cooldown, burn, tooltip, description, image, effect, effect_burn, vars in conn.execute(
+			'SELECT name, cooldown, cooldown_burn, tooltip, description, image, effect, effect_burn, vars '
+			'FROM spells WHERE key = ? ORDER BY slot',
+			(key,),
+		):
+			spells.append({
+				'name': name,
+				'cooldown': json.loads(cooldown or '[]'),
+				'cooldownBurn': burn,
+				'tooltip': tooltip,
+				'description': description,
+				'image': _image(image),
+				'effect': json.loads(effect or '[]'),
+				'effectBurn': json.loads(effect_burn or '[]'),
+				'vars': json.loads(vars or '[]'),
+			})
+		return ChampionRecord.from_ddragon({'id': row[0], 'name': row[1], 'title': row[2], 'image': _image(row[3]), 'spells': spells})
@@ -0,0 +1,172 @@
+"""``leaguesheet`` command-line interface.
+
+Examples::
+
+	python -m leaguesheet lookup Ahri "kai'sa" mundo
+	type roster.txt | python -m leaguesheet lookup --format csv > sheet.csv
+	python -m leaguesheet prefetch
+	python -m leaguesheet prefetch --engine asyncio
+	python -m leaguesheet import dragontail-14.1.1.tgz
+	python -m leaguesheet matrix --haste 20 --slot R --rank 3 --max 80 --sort R
+"""
+
+import argparse
+import concurrent.futures
+import csv
+import json
+import sys
+import time
+
+from . import metrics
+from .ddragon import DD_LOCALE, LOCALES, SLOTS, DataDragon
+from .dragontail import import_dragontail
+from .engines import ENGINES, make_engine
+
+
+CSV_FIELDS = ['input', 'name', 'key', 'version'] + SLOTS + ['error', 'elapsed_ms']
+
+
+def _iter_names(names, stdin):
+	if names and names != ['-']:
+		yield from names
+		return
+	for line in stdin:
+		line = line.strip()
+		if line:
+			yield line
+
+
+def _timed_lookup(dd, name, mode, rank=None):
+	start = time.perf_counter()
+	try:
+		row = dd.lookup(name, mode=mode, rank=rank)
+		if row is None:
+			row = {'input': name, 'error': 'not found'}
+	except Exception as exc:
+		row = {'input': name, 'error': str(exc) or exc.__class__.__name__}
+	row['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 2)
+	return row
+
+
+def cmd_lookup(dd, args, out):
+	mode = 'Cooldown' if args.mode == 'cooldown' else 'Description'
+	writer = None
+	if args.format == 'csv':
+		writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction='ignore')
+		writer.writeheader()
+	start = time.perf_counter()
+	count = 0
+	# resolve the patch once up front so workers don't race to load it
+	dd.load_champion_key_map()
+	with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as pool:
+		futures = [pool.submit(_timed_lookup, dd, name, mode, args.rank) for name in _iter_names(args.names, sys.stdin)]
+		# stream rows as they complete rather than in input order
+		for fut in concurrent.futures.as_completed(futures):
+			row = fut.result()
+			if writer:
+				writer.writerow(row)
+			else:
+				out.write(json.dumps(row, ensure_ascii=False) + '\n')
+			out.flush()
+			count += 1
+	elapsed = time.perf_counter() - start
+	rate = count / elapsed if elapsed else 0.0
+	print(f'{count} rows in {elapsed:.3f}s ({rate:.1f} rows/s)', file=sys.stderr)
+	return 0
+
+
+def cmd_prefetch(dd, args, out):
+	start = time.perf_counter()
+	if args.engine != 'bulk':
+		# one request per champion through the chosen engine (warms the JSON cache)
+		with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as pool:
+			engine = make_engine(args.engine, dd, pool)
+			try:
+				count = engine.prefetch_roster().result()
+			finally:
+				engine.close()
+		print(f'{count} champions fetched with {args.engine} in {time.perf_counter() - start:.2f}s', file=sys.stderr)
+		return 0
+	with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as pool:
+		db = dd.ensure_champion_db(executor=pool, on_build=lambda v: print(f'building champion database for {v}...', file=sys.stderr))
+	print(f'{db.version}: {len(db.names())} champions ready in {time.perf_counter() - start:.2f}s', file=sys.stderr)
+	return 0
+
+
+def cmd_matrix(dd, args, out):
+	with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as pool:
+		matrix = dd.cooldown_matrix(executor=pool)
+	slot = SLOTS.index(args.slot) if args.slot else None
+	sort = SLOTS.index(args.sort) if args.sort and args.sort != 'name' else None
+	idx = matrix.select(haste=args.haste, rank=args.rank or 1, slot=slot, max_cd=args.max, min_cd=args.min,
+		name=args.name, sort=sort, descending=args.desc)
+	fields = ['name', 'key'] + SLOTS
+	writer = None
+	if args.format == 'csv':
+		writer = csv.DictWriter(out, fieldnames=fields)
+		writer.writeheader()
+	for i in idx:
+		row = dict(zip(fields, [matrix.names[i], matrix.keys[i]] + matrix.cells(i, args.haste, args.rank)))
+		if writer:
+			writer.writerow(row)
+		else:
+			out.write(json.dumps(row, ensure_ascii=False) + '\n')
+	print(f'{len(idx)} of {len(matrix)} champions ({matrix.version}, {args.haste:g} ability haste)', file=sys.stderr)
+	return 0
+
+
+def cmd_import(dd, args, out):
+	version, counts = import_dragontail(args.archive, dd.dd_cache, dd.icon_store, (dd.data_locale, dd.locale))
+	print(f'imported {version}: {counts["json"]} json documents, {counts["icons"]} icons', file=sys.stderr)
+	return 0
+
+
+def build_parser():
+	parser = argparse.ArgumentParser(prog='leaguesheet', description='League of Legends cooldown lookups from Data Dragon.')
+	parser.add_argument('--data-dir', default=None, help='cache directory (default: per-user data dir)')
+	parser.add_argument('--locale', default=DD_LOCALE, choices=LOCALES, help='language of names and tooltips (default en_US)')
+	parser.add_argument('--offline', action='store_true', help='use only cached data (last good patch)')
+	parser.add_argument('--workers', type=int, default=16, help='concurrent lookups (default 16)')
+	parser.add_argument('--trace', default=None, help='write a Chrome trace of the run to this file')
+	sub = parser.add_subparsers(dest='command', required=True)
+
+	p = sub.add_parser('lookup', help='look up champions and stream one row per champion')
+	p.add_argument('names', nargs='*', help='champion names; read from stdin (one per line) when omitted or "-"')
+	p.add_argument('--format', choices=('json', 'csv'), default='json', help='JSON lines (default) or CSV')
+	p.add_argument('--mode', choices=('cooldown', 'description'), default='cooldown')
+	p.add_argument('--rank', type=int, default=None, help='show one ability rank instead of all of them')
+	p.set_defaults(func=cmd_lookup)
+
+	p = sub.add_parser('prefetch', help='download the whole roster for the current patch')
+	p.add_argument('--engine', choices=('bulk',) + ENGINES, default='bulk',
+		help='bulk: one championFull.json into the champion database (default); '
+		'threads/asyncio: one request per champion')
+	p.set_defaults(func=cmd_prefetch)
+
+	p = sub.add_parser('matrix', help='every champion\'s cooldowns, scaled by ability haste')
+	p.add_argument('--haste', type=float, default=0.0, help='ability haste (default 0)')
+	p.add_argument('--rank', type=int, default=None, help='show one rank instead of all of them')
+	p.add_argument('--slot', choices=SLOTS, default=None, help='ability tested by --max/--min')
+	p.add_argument('--max', type=float, default=None, help='keep champions whose --slot cooldown is at most this')
+	p.add_argument('--min', type=float, default=None, help='keep champions whose --slot cooldown is at least this')
+	p.add_argument('--name', default=None, help='keep names containing this text')
+	p.add_argument('--sort', choices=['name'] + SLOTS, default='name')
+	p.add_argument('--desc', action='store_true', help='sort descending')
+	p.add_argument('--format', choices=('json', 'csv'), default='json')
+	p.set_defaults(func=cmd_matrix)
+
+	p = sub.add_parser('import', help='import a dragontail-<version>.tgz archive')
+	p.add_argument('archive')
+	p.set_defaults(func=cmd_import)
+	return parser
+
+
+def main(argv=None, out=None):
+	args = build_parser().parse_args(argv)
+	dd = DataDragon(data_dir=args.data_dir, locale=args.locale, offline=args.offline or None, max_workers=args.workers)
+	try:
+		return args.func(dd, args, out or sys.stdout)
+	finally:
+		dd.close()
+		if args.trace:
+			metrics.METRICS.export_chrome_trace(args.trace)
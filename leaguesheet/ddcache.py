@@ -0,0 +1,190 @@
+"""Persistent on-disk cache for Data Dragon JSON documents.
+
+Files are laid out as ``<root>/<version>/<locale>/<name>.json`` so a new patch
+never collides with the previous one. Writes are atomic (temp file + rename),
+the total size is bounded by evicting the least recently used files, and the
+last patch that loaded successfully is remembered so the app can keep working
+offline.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+from . import metrics
+
+
+STATE_FILE = 'state.json'
+
+
+def atomic_write_bytes(path, data):
+	# Write to a temp file in the same directory, then rename over the target
+	# so readers never see a half-written file.
+	dirpath = os.path.dirname(path)
+	os.makedirs(dirpath, exist_ok=True)
+	fd, tmp = tempfile.mkstemp(dir=dirpath, prefix='.tmp-')
+	try:
+		with os.fdopen(fd, 'wb') as f:
+			f.write(data)
+		os.replace(tmp, path)
+	except Exception:
+		try:
+			os.remove(tmp)
+		except OSError:
+			pass
+		raise
+
+
+class DDragonCache:
+	"""Patch- and locale-keyed JSON cache with size-bounded LRU eviction."""
+
+	def __init__(self, root, max_bytes=64 * 1024 * 1024, version_ttl=6 * 3600, offline=False):
+		self.root = root
+		self.max_bytes = max_bytes
+		self.version_ttl = version_ttl
+		self.offline = offline
+		self._lock = threading.Lock()
+		self._total = None
+		self._state = None
+		os.makedirs(root, exist_ok=True)
+
+	# --- state (latest / last good version) ---
+
+	def _load_state(self):
+		if self._state is None:
+			try:
+				with open(os.path.join(self.root, STATE_FILE), encoding='utf-8') as f:
+					self._state = json.load(f)
+			except Exception:
+				self._state = {}
+		return self._state
+
+	def _save_state(self):
+		data = json.dumps(self._state).encode('utf-8')
+		atomic_write_bytes(os.path.join(self.root, STATE_FILE), data)
+
+	def update_state(self, **values):
+		with self._lock:
+			self._load_state().update(values)
+			try:
+				self._save_state()
+			except Exception:
+				pass
+
+	def state(self, key, default=None):
+		with self._lock:
+			return self._load_state().get(key, default)
+
+	def last_good_version(self):
+		return self.state('last_good_version')
+
+	def mark_good(self, version):
+		if self.last_good_version() != version:
+			self.update_state(last_good_version=version)
+
+	def fresh_version(self):
+		"""Return the last fetched latest version if it was checked recently.
+
+		In offline mode the last good version is always returned.
+		"""
+		if self.offline:
+			return self.last_good_version()
+		checked = self.state('version_checked_at', 0)
+		if time.time() - checked < self.version_ttl:
+			return self.state('latest_version')
+		return None
+
+	def set_latest_version(self, version, **validators):
+		"""Record the latest version; ``validators`` are the versions.json ETag/Last-Modified."""
+		self.update_state(latest_version=version, version_checked_at=time.time(), **validators)
+
+	# --- documents ---
+
+	def path_for(self, version, locale, name):
+		return os.path.join(self.root, version, locale, name + '.json')
+
+	def get(self, version, locale, name):
+		path = self.path_for(version, locale, name)
+		try:
+			with open(path, 'rb') as f:
+				data = json.loads(f.read().decode('utf-8'))
+		except (OSError, ValueError):
+			return None
+		try:
+			# bump mtime so eviction treats this entry as recently used
+			os.utime(path, None)
+		except OSError:
+			pass
+		return data
+
+	def put(self, version, locale, name, data):
+		payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+		path = self.path_for(version, locale, name)
+		try:
+			old_size = os.path.getsize(path)
+		except OSError:
+			old_size = 0
+		atomic_write_bytes(path, payload)
+		with self._lock:
+			if self._total is not None:
+				self._total += len(payload) - old_size
+		self.evict()
+
+	def get_or_fetch(self, version, locale, name, fetch):
+		"""Return the cached document, calling ``fetch()`` and storing on a miss."""
+		data = self.get(version, locale, name)
+		if data is not None:
+			metrics.count('json_cache.hit')
+			return data
+		metrics.count('json_cache.miss')
+		if self.offline:
+			raise LookupError(f'{version}/{locale}/{name} not cached (offline)')
+		data = fetch()
+		try:
+			self.put(version, locale, name, data)
+		except Exception:
+			pass
+		return data
+
+	# --- eviction ---
+
+	def _entries(self):
+		entries = []
+		for dirpath, _dirs, files in os.walk(self.root):
+			for fn in files:
+				if fn == STATE_FILE or fn.startswith('.tmp-'):
+					continue
+				path = os.path.join(dirpath, fn)
+				try:
+					st = os.stat(path)
+				except OSError:
+					continue
+				entries.append((st.st_mtime, st.st_size, path))
+		return entries
+
+	def evict(self):
+		with self._lock:
+			if self._total is not None and self._total <= self.max_bytes:
+				return
+			entries = self._entries()
+			total = sum(e[1] for e in entries)
+			if total > self.max_bytes:
+				# never evict the champion index of the last good patch; it is
+				# what offline mode falls back to
+				keep = None
+				good = self._load_state().get('last_good_version')
+				if good:
+					keep = os.path.join(self.root, good)
+				for mtime, size, path in sorted(entries):
+					if total <= self.max_bytes:
+						break
+					if keep and path.startswith(keep) and os.path.basename(path) == 'champion.json':
+						continue
+					try:
+						os.remove(path)
+						total -= size
+					except OSError:
+						pass
+			self._total = total
@@ -0,0 +1,349 @@
+"""Headless Data Dragon data layer.
+
+Everything needed to turn a typed champion name into cooldowns, tooltips and
+icon bytes lives here, free of any Tkinter dependency, so it can be imported by
+the GUI, the ``leaguesheet`` CLI and benchmarks alike.
+"""
+
+import concurrent.futures
+import os
+from functools import lru_cache
+
+from . import metrics
+from .bulk import iter_champions_full
+from .championdb import ChampionDB, build_bundle, bundle_path, remove_stale_bundles
+from .ddcache import DDragonCache
+from .fetch import HttpClient
+from .iconcache import IconStore
+from .paths import get_user_data_dir
+from .records import ChampionRecord, champion_text
+from .resolver import ChampionResolver
+from .singleflight import SingleFlight
+from .sprites import SpriteSheets, has_sprite
+from .tooltips import spell_text
+
+
+# Overridable so benchmarks and tests can point the app at a local stand-in.
+DDRAGON_VERSIONS_URL = os.getenv('LEAGUESHEET_VERSIONS_URL', "https://ddragon.leagueoflegends.com/api/versions.json")
+DD_BASE = os.getenv('LEAGUESHEET_DD_BASE', "https://ddragon.leagueoflegends.com/cdn")
+DD_LOCALE = 'en_US'
+# languages Data Dragon publishes
+LOCALES = (
+	'en_US', 'en_GB', 'en_AU', 'en_PH', 'en_SG', 'cs_CZ', 'de_DE', 'el_GR', 'es_AR', 'es_ES', 'es_MX',
+	'fr_FR', 'hu_HU', 'it_IT', 'ja_JP', 'ko_KR', 'pl_PL', 'pt_BR', 'ro_RO', 'ru_RU', 'th_TH', 'tr_TR',
+	'vi_VN', 'zh_CN', 'zh_MY', 'zh_TW',
+)
+
+SLOTS = ['Q', 'W', 'E', 'R']
+ICON_SIZES = {'champion': 48, 'spell': 32}
+
+
+class DataDragon:
+	"""Cached access to Data Dragon for one data directory.
+
+	Numbers, image names and sprite coordinates are the same in every
+	language, so champion data, the bundle and the icons come from one data
+	locale per patch. Any other display ``locale`` only adds its strings
+	(names, titles, tooltips, descriptions) on top.
+	"""
+
+	def __init__(self, data_dir=None, locale=DD_LOCALE, offline=None, max_workers=16,
+			versions_url=None, base_url=None, sprites=None):
+		self.data_dir = data_dir or get_user_data_dir()
+		self.locale = locale
+		self.data_locale = DD_LOCALE
+		self.versions_url = versions_url or DDRAGON_VERSIONS_URL
+		self.base_url = base_url or DD_BASE
+		if offline is None:
+			offline = os.getenv('LEAGUESHEET_OFFLINE') == '1'
+		# Persistent JSON cache; offline mode serves the last good patch only.
+		self.dd_cache = DDragonCache(os.path.join(self.data_dir, 'ddragon'), offline=offline)
+		# Pre-resized icon PNGs keyed by (version, image name, size).
+		self.icon_store = IconStore(os.path.join(self.data_dir, 'icons'))
+		# Sprite atlases: icons are cropped from a few sheets per patch instead
+		# of one download each. LEAGUESHEET_SPRITES=0 falls back to single icons.
+		if sprites is None:
+			sprites = os.getenv('LEAGUESHEET_SPRITES', '1') != '0'
+		self.use_sprites = sprites
+		self.sprites = SpriteSheets(os.path.join(self.data_dir, 'sprites'))
+		# One pooled keep-alive session for all ddragon traffic, sized to the workers
+		self.http = HttpClient(pool_size=max_workers)
+		# Indexed per-patch champion database, built on the first launch of a
+		# patch. Lookups fall back to the JSON path until it is ready.
+		self.db_dir = os.path.join(self.data_dir, 'db')
+		self._db = None
+		self._db_checked = set()
+		self._matrix = None
+		# per-instance memoization; the single-flight groups make concurrent
+		# misses for the same item share one load instead of racing
+		self._flights = SingleFlight('dd.coalesced')
+		self.load_champion_key_map = lru_cache(maxsize=1)(self._load_champion_key_map_once)
+		# compact parsed records (not JSON blobs), so the whole roster fits
+		self.fetch_champion_data = lru_cache(maxsize=256)(self._fetch_champion_data_once)
+		# localized strings only, per (champion, patch, locale)
+		self.champion_text = lru_cache(maxsize=256)(self._champion_text_once)
+
+	@property
+	def offline(self):
+		return self.dd_cache.offline
+
+	def close(self):
+		self.http.close()
+
+	def set_locale(self, locale):
+		"""Switch the display language; cached numbers and icons stay as they are."""
+		if locale == self.locale:
+			return
+		self.locale = locale
+		# the resolver also matches the localized display names
+		self.load_champion_key_map.cache_clear()
+		metrics.event('locale', locale=locale)
+
+	# --- versions and champion index ---
+
+	def get_latest_dd_version(self, timeout=5):
+		# Reuse a recently checked version so warm starts skip versions.json.
+		version = self.dd_cache.fresh_version()
+		if version:
+			return version
+		if self.offline:
+			raise LookupError('no cached Data Dragon version (offline)')
+		# revalidate with the stored validators; a 304 costs no body at all
+		latest = self.dd_cache.state('latest_version')
+		headers = {}
+		if latest:
+			etag = self.dd_cache.state('versions_etag')
+			modified = self.dd_cache.state('versions_last_modified')
+			if etag:
+				headers['If-None-Match'] = etag
+			if modified:
+				headers['If-Modified-Since'] = modified
+		try:
+			resp = self.http.get(self.versions_url, timeout=timeout, headers=headers or None)
+			if resp.status_code == 304 and latest:
+				metrics.count('versions.not_modified')
+				version = latest
+			else:
+				version = resp.json()[0]
+		except Exception:
+			# ddragon slow or unreachable: fall back to the last patch that worked
+			version = self.dd_cache.last_good_version()
+			if not version:
+				raise
+			return version
+		self.dd_cache.set_latest_version(
+			version,
+			versions_etag=resp.headers.get('ETag') or self.dd_cache.state('versions_etag'),
+			versions_last_modified=resp.headers.get('Last-Modified') or self.dd_cache.state('versions_last_modified'),
+		)
+		return version
+
+	def _load_champion_key_map_once(self, version=None, timeout=5):
+		return self._flights.do(('key_map', version), self._load_champion_key_map, version, timeout)
+
+	def _load_champion_key_map(self, version=None, timeout=5):
+		if not version:
+			version = self.get_latest_dd_version(timeout=timeout)
+
+		def fetch():
+			return self.http.get_json(f"{self.base_url}/{version}/data/{self.data_locale}/champion.json", timeout=timeout)
+
+		try:
+			doc = self.dd_cache.get_or_fetch(version, self.data_locale, 'champion', fetch)
+		except Exception:
+			# the new patch is unreachable; serve the last good one if it differs
+			good = self.dd_cache.last_good_version()
+			if not good or good == version:
+				raise
+			version = good
+			doc = self.dd_cache.get_or_fetch(version, self.data_locale, 'champion', fetch)
+		self.dd_cache.mark_good(version)
+		data = doc.get("data", {})
+		display_names = {info.get('id', key) for key, info in data.items()}
+		# return the shared name resolver, version, and a sorted list of display names
+		return ChampionResolver.from_ddragon(data, self._localized_names(version, timeout)), version, sorted(display_names, key=lambda s: s.lower())
+
+	def _localized_names(self, version, timeout=5):
+		# champion.json in the display locale, for its champion names only
+		locale = self.locale
+		if locale == self.data_locale:
+			return None
+
+		def fetch():
+			return self.http.get_json(f"{self.base_url}/{version}/data/{locale}/champion.json", timeout=timeout)
+
+		try:
+			return self.dd_cache.get_or_fetch(version, locale, 'champion', fetch).get('data')
+		except Exception:
+			return None
+
+	# --- champion data ---
+
+	def _fetch_champion_data_once(self, key, version, timeout=5):
+		return self._flights.do(('champion', key, version), self._fetch_champion_data, key, version, timeout)
+
+	def _fetch_champion_data(self, key, version, timeout=5):
+		return ChampionRecord.from_ddragon(self._champion_doc(key, version, timeout))
+
+	def _champion_doc(self, key, version, timeout=5):
+		def fetch():
+			return self.http.get_json(f"{self.base_url}/{version}/data/{self.data_locale}/champion/{key}.json", timeout=timeout)
+
+		return self.dd_cache.get_or_fetch(version, self.data_locale, f'champion/{key}', fetch)["data"][key]
+
+	def _champion_text_once(self, key, version, locale, timeout=5):
+		return self._flights.do(('text', key, version, locale), self._champion_text, key, version, locale, timeout)
+
+	def _champion_text(self, key, version, locale, timeout=5):
+		# only the strings are kept (and cached on disk) per locale; the
+		# numbers in the same payload are already shared from the data locale
+		def fetch():
+			doc = self.http.get_json(f"{self.base_url}/{version}/data/{locale}/champion/{key}.json", timeout=timeout)
+			return champion_text(doc['data'][key])
+
+		with metrics.span('champion_text', key=key, locale=locale):
+			# a dragontail archive imported for this locale has the full document
+			full = self.dd_cache.get(version, locale, f'champion/{key}')
+			if full is not None:
+				return champion_text(full['data'][key])
+			return self.dd_cache.get_or_fetch(version, locale, f'text/{key}', fetch)
+
+	def localize(self, record, version, timeout=5):
+		"""``record`` with the display locale's strings (itself in the data locale)."""
+		locale = self.locale
+		if record is None or locale == self.data_locale or record.locale == locale:
+			return record
+		try:
+			return record.with_text(self.champion_text(record.key, version, locale, timeout), locale)
+		except Exception:
+			# text not reachable (offline, say): the data locale's is better than none
+			metrics.count('locale.fallback')
+			return record
+
+	def current_db(self, version):
+		db = self._db
+		if db is not None and db.version == version:
+			return db
+		# pick up a bundle built by an earlier run (or another process) once
+		if version not in self._db_checked:
+			self._db_checked.add(version)
+			db = ChampionDB.open(bundle_path(self.db_dir, version, self.data_locale))
+			if db is not None:
+				self._db = db
+				return db
+		return None
+
+	def champion_data(self, champ_key, version, timeout=5):
+		# indexed bundle when it is built for this patch, else the JSON path
+		with metrics.span('champion_json', key=champ_key) as sp:
+			db = self.current_db(version)
+			data = db.champion_data(champ_key) if db is not None else None
+			if data is not None:
+				sp['source'] = 'db'
+			else:
+				sp['source'] = 'json'
+				data = self.fetch_champion_data(champ_key, version, timeout=timeout)
+		return self.localize(data, version, timeout)
+
+	def iter_roster_full(self, version):
+		# Whole roster in one streamed championFull.json request; each slimmed
+		# champion also warms the per-champion JSON cache.
+		url = f"{self.base_url}/{version}/data/{self.data_locale}/championFull.json"
+		for key, info in iter_champions_full(self.http.iter_bytes(url)):
+			try:
+				self.dd_cache.put(version, self.data_locale, f'champion/{key}', {'data': {key: info}})
+			except Exception:
+				pass
+			yield info
+
+	def ensure_champion_db(self, version=None, executor=None, on_build=None):
+		"""Open (building if needed) the champion bundle for ``version``."""
+		resolver, version, _ = self.load_champion_key_map(version)
+		# the startup updater, the roster view and an archive import can all
+		# ask at once; one of them builds, the others wait for its bundle
+		return self._flights.do(('bundle', version), self._ensure_champion_db, resolver, version, executor, on_build)
+
+	def _ensure_champion_db(self, resolver, version, executor=None, on_build=None):
+		path = bundle_path(self.db_dir, version, self.data_locale)
+		db = ChampionDB.open(path)
+		if db is None:
+			if on_build:
+				on_build(version)
+			try:
+				if self.offline:
+					raise LookupError('offline')
+				build_bundle(path, version, self.data_locale, self.iter_roster_full(version))
+			except Exception:
+				# per-champion fallback (served from the JSON cache where possible);
+				# bypass the lru_cache so the build doesn't pin every champion's JSON
+				keys = sorted(resolver.keys())
+				own = executor is None
+				pool = executor or concurrent.futures.ThreadPoolExecutor(max_workers=8)
+				try:
+					champions = pool.map(lambda k: self._champion_doc(k, version), keys)
+					build_bundle(path, version, self.data_locale, champions)
+				finally:
+					if own:
+						pool.shutdown(wait=False)
+			remove_stale_bundles(self.db_dir, path)
+			self.sprites.prune(version)
+			db = ChampionDB.open(path)
+		self._db = db
+		return db
+
+	def cooldown_matrix(self, version=None, executor=None):
+		"""Every champion's cooldowns as a :class:`~leaguesheet.matrix.CooldownMatrix`."""
+		# NumPy is only needed for the roster view; keep it off the startup path
+		from .matrix import CooldownMatrix
+
+		db = self.ensure_champion_db(version, executor=executor)
+		matrix = self._matrix
+		if matrix is None or matrix.version != db.version:
+			with metrics.span('cooldown_matrix', version=db.version):
+				matrix = CooldownMatrix.from_rows(db.version, db.champions(), db.cooldowns())
+			self._matrix = matrix
+		return matrix
+
+	# --- icons ---
+
+	def sprite_url(self, version, sprite):
+		return f"{self.base_url}/{version}/img/sprite/{sprite}"
+
+	def icon_png(self, kind, version, img_full, size=None, timeout=5, image=None):
+		"""Resized PNG bytes for a champion/spell image, from the icon store when possible.
+
+		``image`` is the record's :class:`~leaguesheet.records.ImageRef`; when it
+		carries sprite coordinates the icon is cropped from the patch's sprite sheet.
+		"""
+		size = size or ICON_SIZES[kind]
+		name = f'{kind}/{img_full}'
+		if self.use_sprites and has_sprite(image):
+			def fetch_sheet():
+				return self.http.get_bytes(self.sprite_url(version, image.sprite), timeout=timeout)
+
+			def create():
+				return self.icon_store.get_or_render(version, name, size, lambda: self.sprites.render(version, image, size, fetch_sheet))
+		else:
+			def fetch():
+				return self.http.get_bytes(f"{self.base_url}/{version}/img/{kind}/{img_full}", timeout=timeout)
+
+			def create():
+				return self.icon_store.get_or_create(version, name, size, fetch)
+
+		with metrics.span('icon_fetch', image=img_full, size=size):
+			return self._flights.do(('icon', version, name, size), create)
+
+	# --- lookups ---
+
+	def lookup(self, champ_input_name, mode='Cooldown', timeout=5, rank=None):
+		"""Resolve and fetch one row; returns a plain dict or None if not found."""
+		resolver, version, _ = self.load_champion_key_map()
+		with metrics.span('resolve', name=champ_input_name):
+			champ_key = resolver.resolve(champ_input_name)
+		if not champ_key:
+			return None
+		data = self.champion_data(champ_key, version, timeout=timeout)
+		row = {'input': champ_input_name, 'key': champ_key, 'name': data.name or champ_key, 'version': version}
+		for i, slot in enumerate(SLOTS):
+			row[slot] = spell_text(version, data, i, mode, rank)
+		return row
@@ -0,0 +1,104 @@
+"""Import a downloaded Data Dragon ``dragontail-<version>.tgz`` archive.
+
+The tarball is read as a stream (no extraction to disk): champion JSON goes
+straight into the JSON cache and champion/spell images are resized into the
+icon store, so the app can run fully offline against that patch.
+
+Usage::
+
+	python -m leaguesheet.dragontail dragontail-14.1.1.tgz [--locale en_US]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import tarfile
+
+from .ddcache import DDragonCache
+from .ddragon import ICON_SIZES
+from .iconcache import IconStore, resize_png
+from .paths import get_user_data_dir
+
+_VERSION_RE = re.compile(r'^\d+(\.\d+)+$')
+
+
+def _version_tuple(version):
+	return tuple(int(p) for p in version.split('.') if p.isdigit())
+
+
+def version_from_filename(path):
+	m = re.search(r'dragontail-(\d+(?:\.\d+)+)', os.path.basename(path))
+	return m.group(1) if m else None
+
+
+def import_dragontail(path, dd_cache, icon_store, locales=('en_US',), progress=None):
+	"""Stream ``path`` into the caches and return ``(version, counts)``."""
+	version = version_from_filename(path)
+	counts = {'json': 0, 'icons': 0}
+	seen = 0
+	with tarfile.open(path, mode='r|*') as tar:
+		for member in tar:
+			seen += 1
+			if progress and seen % 500 == 0:
+				progress(seen, counts)
+			if not member.isfile():
+				continue
+			parts = member.name.lstrip('./').split('/')
+			# versioned members look like <version>/data/... or <version>/img/...
+			if len(parts) < 3 or not _VERSION_RE.match(parts[0]):
+				continue
+			if version is None:
+				version = parts[0]
+			elif parts[0] != version:
+				continue
+			rest = parts[1:]
+			if rest[0] == 'data' and len(rest) >= 3 and rest[1] in locales:
+				locale = rest[1]
+				if rest[2:] == ['champion.json']:
+					name = 'champion'
+				elif len(rest) == 4 and rest[2] == 'champion' and rest[3].endswith('.json'):
+					name = 'champion/' + rest[3][:-5]
+				else:
+					continue
+				f = tar.extractfile(member)
+				dd_cache.put(version, locale, name, json.loads(f.read().decode('utf-8')))
+				counts['json'] += 1
+			elif rest[0] == 'img' and len(rest) == 3 and rest[1] in ICON_SIZES:
+				kind, img_full = rest[1], rest[2]
+				size = ICON_SIZES[kind]
+				f = tar.extractfile(member)
+				try:
+					png = resize_png(f.read(), size)
+				except Exception:
+					continue
+				icon_store.put(version, f'{kind}/{img_full}', size, png)
+				counts['icons'] += 1
+	if not version or not counts['json']:
+		raise ValueError(f'{path}: no Data Dragon champion data found')
+	# only advance the offline fallback; importing an older archive must not
+	# replace a newer patch that already works
+	good = dd_cache.last_good_version()
+	if not good or _version_tuple(version) >= _version_tuple(good):
+		dd_cache.mark_good(version)
+	return version, counts
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description='Import a Data Dragon dragontail archive into the LeagueSheet cache.')
+	parser.add_argument('archive', help='path to dragontail-<version>.tgz')
+	parser.add_argument('--locale', action='append', help='locale(s) to import (default en_US)')
+	parser.add_argument('--data-dir', default=None, help='LeagueSheet data directory (default: per-user data dir)')
+	args = parser.parse_args(argv)
+	data_dir = args.data_dir or get_user_data_dir()
+	dd_cache = DDragonCache(os.path.join(data_dir, 'ddragon'))
+	icon_store = IconStore(os.path.join(data_dir, 'icons'))
+	progress = lambda n, c: print(f'{n} members read, {c["json"]} json, {c["icons"]} icons', file=sys.stderr)
+	version, counts = import_dragontail(args.archive, dd_cache, icon_store, tuple(args.locale or ['en_US']), progress)
+	print(f'imported {version}: {counts["json"]} json documents, {counts["icons"]} icons')
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,105 @@
+"""Fetch engines that run row lookups and roster prefetches.
+
+Both engines return ``concurrent.futures.Future`` objects so callers (the GUI,
+the CLI, benchmarks) don't care which one is in use:
+
+- ``threads``: task graphs on a bounded ``ThreadPoolExecutor`` (blocking HTTP
+  through the pooled ``requests`` session).
+- ``asyncio``: one event loop on a background thread with a non-blocking
+  ``aiohttp`` client; see :mod:`leaguesheet.aioengine`.
+
+A row result is ``None`` (not found / superseded) or a dict with ``version``,
+``key``, ``data`` (:class:`~leaguesheet.records.ChampionRecord`) and ``icons`` (PNG bytes or None, in
+:func:`icon_specs` order).
+"""
+
+import os
+
+from . import metrics
+from .ddragon import ICON_SIZES, SLOTS
+from .pipeline import Scheduler, completed
+from .records import ImageRef
+
+
+ENGINES = ('threads', 'asyncio')
+
+
+def icon_specs(data):
+	"""``(kind, ImageRef, size)`` for the portrait and the Q/W/E/R icons of a champion."""
+	specs = [('champion', data.image, ICON_SIZES['champion'])]
+	for i in range(len(SLOTS)):
+		spell = data.spell(i)
+		specs.append(('spell', spell.image if spell else ImageRef(None), ICON_SIZES['spell']))
+	return specs
+
+
+class ThreadEngine:
+	"""Row lookups as future-chained task graphs on a thread pool."""
+
+	name = 'threads'
+
+	def __init__(self, dd, executor):
+		self.dd = dd
+		self.executor = executor
+		self.scheduler = Scheduler(executor)
+
+	def lookup_row(self, name, is_current=None):
+		"""Resolve ``name``, fetch its JSON, then all five icons concurrently."""
+		dd = self.dd
+		scheduler = self.scheduler
+
+		def resolve_and_fetch():
+			if is_current and not is_current():
+				return None
+			resolver, version, _ = dd.load_champion_key_map()
+			with metrics.span('resolve', name=name):
+				champ_key = resolver.resolve(name)
+			if not champ_key:
+				return None
+			return version, champ_key, dd.champion_data(champ_key, version)
+
+		def icon_or_none(kind, version, image, size):
+			if not image.full:
+				return None
+			try:
+				return dd.icon_png(kind, version, image.full, size, image=image)
+			except Exception:
+				return None
+
+		def fetch_icons(resolved):
+			# a newer lookup for this row started: skip the icon fan-out
+			if not resolved or (is_current and not is_current()):
+				return completed(None)
+			version, champ_key, data = resolved
+			jobs = [scheduler.submit(icon_or_none, kind, version, img, size) for kind, img, size in icon_specs(data)]
+			return scheduler.then(
+				scheduler.when_all(jobs),
+				lambda futs: {'version': version, 'key': champ_key, 'data': data, 'icons': [f.result() for f in futs]},
+			)
+
+		return scheduler.then(scheduler.submit(resolve_and_fetch), fetch_icons)
+
+	def prefetch_roster(self, version=None):
+		"""Fetch every champion's JSON (one request each) into the cache."""
+		dd = self.dd
+
+		def run():
+			resolver, v, _ = dd.load_champion_key_map(version)
+			keys = sorted(resolver.keys())
+			return len(list(self.executor.map(lambda k: dd.fetch_champion_data(k, v), keys)))
+
+		return self.scheduler.submit(run)
+
+	def close(self):
+		pass
+
+
+def make_engine(kind, dd, executor, max_concurrency=256):
+	"""Build the engine named ``kind`` (default from ``LEAGUESHEET_ENGINE``)."""
+	kind = kind or os.getenv('LEAGUESHEET_ENGINE') or 'threads'
+	if kind == 'asyncio':
+		from .aioengine import AsyncEngine
+		return AsyncEngine(dd, max_concurrency=max_concurrency)
+	if kind != 'threads':
+		raise ValueError(f'unknown engine {kind!r} (expected one of {", ".join(ENGINES)})')
+	return ThreadEngine(dd, executor)
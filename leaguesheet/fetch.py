@@ -0,0 +1,88 @@
+"""Shared HTTP fetch layer built on one pooled ``requests.Session``.
+
+Connections to ddragon are kept alive and reused across lookups, the pool is
+sized to the worker count so concurrency stays bounded, transient failures are
+retried with jittered exponential backoff, and every request is timed.
+"""
+
+import random
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import metrics
+from .singleflight import SingleFlight
+
+
+# statuses worth retrying: rate limiting and transient server/CDN errors
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+class RetryableStatus(requests.HTTPError):
+	pass
+
+
+class HttpClient:
+	"""Pooled, retrying HTTP client shared by all network access in the app."""
+
+	def __init__(self, pool_size=4, retries=3, backoff=0.25, max_backoff=4.0, timeout=5, user_agent='LeagueSheet'):
+		self.retries = retries
+		self.backoff = backoff
+		self.max_backoff = max_backoff
+		self.timeout = timeout
+		self.session = requests.Session()
+		self.session.headers['User-Agent'] = user_agent
+		# pool_block keeps at most pool_size open connections per host, so the
+		# connection count matches the number of workers using this client
+		adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=True, max_retries=0)
+		self.session.mount('https://', adapter)
+		self.session.mount('http://', adapter)
+		# identical concurrent GETs share one request
+		self._flights = SingleFlight('http.coalesced')
+
+	def _sleep_before_retry(self, attempt, resp=None):
+		delay = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+		if resp is not None:
+			retry_after = resp.headers.get('Retry-After', '')
+			if retry_after.isdigit():
+				delay = min(self.max_backoff, max(delay, int(retry_after)))
+		time.sleep(delay)
+
+	def get(self, url, timeout=None, headers=None, stream=False):
+		"""GET ``url`` and return the response, raising once retries are exhausted."""
+		timeout = timeout or self.timeout
+		attempt = 0
+		while True:
+			resp = None
+			try:
+				with metrics.span('http_get', url=url, attempt=attempt) as sp:
+					resp = self.session.get(url, timeout=timeout, headers=headers, stream=stream)
+					sp['status'] = resp.status_code
+				if resp.status_code in RETRY_STATUSES:
+					raise RetryableStatus(f'{resp.status_code} for {url}', response=resp)
+				resp.raise_for_status()
+				return resp
+			except (requests.ConnectionError, requests.Timeout, RetryableStatus):
+				metrics.count('http.retry' if attempt < self.retries else 'http.failed')
+				if attempt >= self.retries:
+					raise
+				self._sleep_before_retry(attempt, resp)
+				attempt += 1
+
+	def get_json(self, url, timeout=None):
+		return self._flights.do(('json', url), lambda: self.get(url, timeout=timeout).json())
+
+	def get_bytes(self, url, timeout=None):
+		return self._flights.do(('bytes', url), lambda: self.get(url, timeout=timeout).content)
+
+	def iter_bytes(self, url, chunk_size=64 * 1024, timeout=None):
+		"""Yield the response body in chunks without holding it all in memory."""
+		resp = self.get(url, timeout=timeout, stream=True)
+		try:
+			yield from resp.iter_content(chunk_size)
+		finally:
+			resp.close()
+
+	def close(self):
+		self.session.close()
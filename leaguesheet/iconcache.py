@@ -0,0 +1,139 @@
+"""Content-addressed disk store for pre-resized champion and spell icons.
+
+Resized PNG bytes are stored once under their SHA-1 digest in ``blobs/`` and a
+small per-patch index maps ``(image name, size)`` to the digest, so icons that
+do not change between patches are shared instead of duplicated.
+
+New index entries are appended to a per-patch journal rather than rewriting
+the index on every put, so filling a whole roster stays linear in disk
+writes; the journal is folded into the index the next time it is loaded.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+
+from PIL import Image
+
+from . import metrics
+from .ddcache import atomic_write_bytes
+
+
+def resize_png(raw, size):
+	"""Decode image bytes, resize to ``size`` x ``size`` and re-encode as PNG."""
+	with metrics.span('icon_resize', size=size):
+		im = Image.open(io.BytesIO(raw))
+		im = im.resize((size, size), Image.LANCZOS)
+		out = io.BytesIO()
+		im.save(out, format='PNG')
+		return out.getvalue()
+
+
+def decode_rgba(png):
+	"""Decode PNG bytes to ``(width, height, rgba bytes)``, ready for a Tk photo."""
+	with metrics.span('icon_decode', bytes=len(png)):
+		im = Image.open(io.BytesIO(png)).convert('RGBA')
+		return im.width, im.height, im.tobytes()
+
+
+class IconStore:
+	"""Icons keyed by (version, image name, size), stored by content hash."""
+
+	def __init__(self, root):
+		self.root = root
+		self._lock = threading.Lock()
+		self._indexes = {}
+		os.makedirs(os.path.join(root, 'blobs'), exist_ok=True)
+		os.makedirs(os.path.join(root, 'index'), exist_ok=True)
+
+	def _blob_path(self, digest):
+		return os.path.join(self.root, 'blobs', digest[:2], digest + '.png')
+
+	def _index_path(self, version):
+		return os.path.join(self.root, 'index', version + '.json')
+
+	def _journal_path(self, version):
+		return os.path.join(self.root, 'index', version + '.log')
+
+	def _index(self, version):
+		# caller holds the lock
+		idx = self._indexes.get(version)
+		if idx is None:
+			try:
+				with open(self._index_path(version), encoding='utf-8') as f:
+					idx = json.load(f)
+			except Exception:
+				idx = {}
+			if self._replay(version, idx):
+				self._compact(version, idx)
+			self._indexes[version] = idx
+		return idx
+
+	def _replay(self, version, idx):
+		try:
+			with open(self._journal_path(version), encoding='utf-8') as f:
+				lines = f.read().splitlines()
+		except OSError:
+			return False
+		for line in lines:
+			# a torn last line (crash mid-append) is skipped; the icon is refetched
+			key, sep, digest = line.rpartition('\t')
+			if sep and len(digest) == 40:
+				idx[key] = digest
+		return True
+
+	def _compact(self, version, idx):
+		try:
+			atomic_write_bytes(self._index_path(version), json.dumps(idx, separators=(',', ':')).encode('utf-8'))
+			os.remove(self._journal_path(version))
+		except OSError:
+			pass
+
+	@staticmethod
+	def _key(name, size):
+		return f'{name}@{size}'
+
+	def get(self, version, name, size):
+		with self._lock:
+			digest = self._index(version).get(self._key(name, size))
+		if not digest:
+			return None
+		try:
+			with open(self._blob_path(digest), 'rb') as f:
+				return f.read()
+		except OSError:
+			return None
+
+	def put(self, version, name, size, png):
+		digest = hashlib.sha1(png).hexdigest()
+		path = self._blob_path(digest)
+		if not os.path.exists(path):
+			atomic_write_bytes(path, png)
+		key = self._key(name, size)
+		with self._lock:
+			idx = self._index(version)
+			if idx.get(key) != digest:
+				idx[key] = digest
+				with open(self._journal_path(version), 'a', encoding='utf-8') as f:
+					f.write(f'{key}\t{digest}\n')
+		return digest
+
+	def get_or_create(self, version, name, size, fetch):
+		"""Return resized PNG bytes, calling ``fetch()`` for the original on a miss."""
+		return self.get_or_render(version, name, size, lambda: resize_png(fetch(), size))
+
+	def get_or_render(self, version, name, size, render):
+		"""Return stored PNG bytes, calling ``render()`` for the final icon on a miss."""
+		png = self.get(version, name, size)
+		if png is not None:
+			metrics.count('icon_cache.hit')
+			return png
+		metrics.count('icon_cache.miss')
+		png = render()
+		try:
+			self.put(version, name, size, png)
+		except Exception:
+			pass
+		return png
@@ -0,0 +1,146 @@
+"""League Live Client Data API poller.
+
+While a game is running the client serves ``/liveclientdata/playerlist`` on
+``https://127.0.0.1:2999``. The poller watches it from a background thread
+and reports the enemy team's champions whenever that roster changes, so the
+sheet can fill itself in during the loading screen.
+
+Polling is adaptive: quick while the API is up but has no roster yet, slow
+once a roster has been seen (it cannot change mid-game), and exponentially
+backed off while no game is running.
+"""
+
+import os
+import random
+import threading
+import warnings
+
+import requests
+import urllib3
+
+from . import metrics
+
+
+LIVE_CLIENT_URL = os.getenv('LEAGUESHEET_LIVECLIENT_URL', 'https://127.0.0.1:2999/liveclientdata')
+
+_RAW_PREFIX = 'game_character_displayname_'
+
+
+def player_champion(player):
+	"""Champion id (preferred, e.g. ``MonkeyKing``) or display name of a player."""
+	raw = player.get('rawChampionName') or ''
+	if raw.startswith(_RAW_PREFIX):
+		return raw[len(_RAW_PREFIX):]
+	return player.get('championName') or None
+
+
+def _player_names(player):
+	names = {player.get('summonerName'), player.get('riotId')}
+	if player.get('riotIdGameName'):
+		names.add(f"{player['riotIdGameName']}#{player.get('riotIdTagLine', '')}")
+		names.add(player['riotIdGameName'])
+	return {n for n in names if n}
+
+
+def enemy_champions(players, active_name=None):
+	"""Champions of the team the active player is not on (CHAOS when unknown)."""
+	own = None
+	if active_name:
+		for p in players:
+			if active_name in _player_names(p):
+				own = p.get('team')
+				break
+	if own is None:
+		own = 'ORDER'
+	return [c for c in (player_champion(p) for p in players if p.get('team') != own) if c]
+
+
+class LiveClientPoller:
+	"""Background poller calling ``on_roster(names)`` when the enemy roster changes."""
+
+	def __init__(self, on_roster, base_url=None, timeout=1.0, active_interval=5.0, waiting_interval=1.0,
+			min_backoff=1.0, max_backoff=15.0):
+		self.on_roster = on_roster
+		self.base_url = (base_url or LIVE_CLIENT_URL).rstrip('/')
+		self.timeout = timeout
+		self.active_interval = active_interval
+		self.waiting_interval = waiting_interval
+		self.min_backoff = min_backoff
+		self.max_backoff = max_backoff
+		self.roster = None
+		self._signature = None
+		self._stop = threading.Event()
+		self._thread = None
+		self._backoff = min_backoff
+		# the game serves a self-signed certificate on loopback only
+		self.session = requests.Session()
+		self.session.verify = False
+
+	def _get(self, path):
+		# unverified on purpose; keep the warning quiet for this request only
+		with warnings.catch_warnings():
+			warnings.simplefilter('ignore', urllib3.exceptions.InsecureRequestWarning)
+			resp = self.session.get(f'{self.base_url}/{path}', timeout=self.timeout)
+		resp.raise_for_status()
+		return resp.json()
+
+	def poll_once(self):
+		"""One poll; returns the enemy roster (None when no game) and reports changes."""
+		try:
+			with metrics.span('live_poll'):
+				players = self._get('playerlist')
+		except (requests.RequestException, ValueError):
+			metrics.count('live.no_game')
+			self.roster = None
+			self._signature = None
+			return None
+		if not isinstance(players, list) or not players:
+			return []
+		# same ten champions as last poll: nothing to work out or report
+		signature = tuple(sorted((str(p.get('team')), str(player_champion(p))) for p in players))
+		if signature == self._signature:
+			return self.roster
+		active = None
+		try:
+			active = self._get('activeplayername')
+		except (requests.RequestException, ValueError):
+			pass
+		self._signature = signature
+		roster = enemy_champions(players, active)
+		if roster and roster != self.roster:
+			self.roster = roster
+			metrics.event('live_roster', champions=roster)
+			self.on_roster(list(roster))
+		return roster
+
+	def next_delay(self, roster):
+		if roster is None:
+			# no game: back off with jitter so an idle client costs next to nothing
+			delay = random.uniform(self._backoff / 2, self._backoff)
+			self._backoff = min(self.max_backoff, self._backoff * 2)
+			return delay
+		self._backoff = self.min_backoff
+		return self.active_interval if roster else self.waiting_interval
+
+	def _run(self, stop):
+		while not stop.is_set():
+			roster = self.poll_once()
+			stop.wait(self.next_delay(roster))
+
+	def start(self):
+		if self._thread is not None and self._thread.is_alive() and not self._stop.is_set():
+			return self
+		# each thread gets its own event: a thread stopped a moment ago may
+		# still be mid-poll, and must exit without taking the new one with it
+		self._stop = threading.Event()
+		self._backoff = self.min_backoff
+		self._thread = threading.Thread(target=self._run, args=(self._stop,), name='leaguesheet-live', daemon=True)
+		self._thread.start()
+		return self
+
+	def stop(self):
+		self._stop.set()
+
+	def close(self):
+		self.stop()
+		self.session.close()
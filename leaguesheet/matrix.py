@@ -0,0 +1,99 @@
+"""Roster-wide cooldown matrix with ability-haste scaling.
+
+Every champion's base cooldowns are held in one ``float32`` array shaped
+``(champions, 4 slots, ranks)``, NaN where a spell has fewer ranks. Ability
+haste scales the whole matrix in one multiply (``cd * 100 / (100 + AH)``), and
+filters and sorts are NumPy masks and argsorts, so redrawing the roster table
+after a haste or filter change costs microseconds, not a pass over JSON.
+"""
+
+import numpy as np
+
+from .ddragon import SLOTS
+
+
+def format_seconds(value):
+	"""``7.3``, ``80`` or ``-`` for a missing rank."""
+	if value != value:
+		return '-'
+	text = f'{value:.1f}'
+	return text[:-2] if text.endswith('.0') else text
+
+
+class CooldownMatrix:
+	"""Base cooldowns of a whole roster for one patch."""
+
+	def __init__(self, version, keys, names, base):
+		self.version = version
+		self.keys = keys
+		self.names = names
+		self.base = base
+		self._lower = np.array([n.lower() for n in names])
+		self._haste = None
+		self._effective = None
+
+	@classmethod
+	def from_rows(cls, version, champions, spells):
+		"""Build from ``(key, name)`` pairs and ``(key, slot, cooldowns)`` rows."""
+		champions = sorted(champions, key=lambda c: c[1].lower())
+		index = {key: i for i, (key, _) in enumerate(champions)}
+		spells = [(index[key], slot, cds) for key, slot, cds in spells if key in index and slot < len(SLOTS)]
+		ranks = max((len(cds) for _, _, cds in spells), default=1)
+		base = np.full((len(champions), len(SLOTS), ranks), np.nan, dtype=np.float32)
+		for i, slot, cds in spells:
+			base[i, slot, :len(cds)] = cds
+		return cls(version, [c[0] for c in champions], [c[1] for c in champions], base)
+
+	@property
+	def ranks(self):
+		return self.base.shape[2]
+
+	def __len__(self):
+		return len(self.keys)
+
+	def effective(self, haste=0):
+		"""Cooldowns after ``haste`` ability haste (the last result is reused)."""
+		if haste != self._haste:
+			self._effective = self.base * np.float32(100.0 / (100.0 + max(0.0, haste)))
+			self._haste = haste
+		return self._effective
+
+	def select(self, haste=0, rank=1, slot=None, max_cd=None, min_cd=None, name=None, sort=None, descending=False):
+		"""Row indices matching the filters, ordered.
+
+		``slot`` (0-3) and ``rank`` (1-based) pick the cooldown that
+		``max_cd``/``min_cd`` test and that ``sort`` (a slot index) orders by;
+		ranks a spell does not have never match. Without ``sort`` rows stay in
+		name order.
+		"""
+		eff = self.effective(haste)
+		r = min(max(rank, 1), self.ranks) - 1
+		mask = np.ones(len(self.keys), dtype=bool)
+		if name:
+			mask &= np.char.find(self._lower, name.lower()) >= 0
+		if slot is not None and (max_cd is not None or min_cd is not None):
+			values = eff[:, slot, r]
+			if max_cd is not None:
+				mask &= values <= max_cd
+			if min_cd is not None:
+				mask &= values >= min_cd
+		idx = np.flatnonzero(mask)
+		if sort is None:
+			return idx[::-1] if descending else idx
+		values = eff[idx, sort, r]
+		# missing ranks sort last either way
+		values = np.where(np.isnan(values), -np.inf if descending else np.inf, values)
+		order = np.argsort(-values if descending else values, kind='stable')
+		return idx[order]
+
+	def cells(self, i, haste=0, rank=None):
+		"""Display strings for Q/W/E/R of row ``i`` at ``rank``, or every rank when None."""
+		eff = self.effective(haste)[i]
+		out = []
+		for slot in range(len(SLOTS)):
+			if rank is not None:
+				out.append(format_seconds(eff[slot, min(max(rank, 1), self.ranks) - 1]))
+				continue
+			values = [format_seconds(v) for v in eff[slot] if v == v]
+			out.append('/'.join(values) or '-')
+		return out
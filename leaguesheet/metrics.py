@@ -0,0 +1,141 @@
+"""Lightweight span and counter recording for diagnosing slow lookups.
+
+``with span('champion_json', key=key):`` records a timed event; ``count('x')``
+bumps a counter (cache hits/misses and so on). Events are kept in a bounded
+ring buffer and can be summarized for the in-app stats panel or exported as a
+Chrome trace (open in chrome://tracing or https://ui.perfetto.dev).
+"""
+
+import collections
+import contextlib
+import json
+import os
+import threading
+import time
+
+
+class Metrics:
+	"""Thread-safe store of timed spans, instant events and counters."""
+
+	def __init__(self, max_events=20000):
+		self._lock = threading.Lock()
+		self._events = collections.deque(maxlen=max_events)
+		self._counters = collections.Counter()
+		self._t0 = time.perf_counter()
+		self.enabled = True
+
+	def _now_us(self):
+		return (time.perf_counter() - self._t0) * 1e6
+
+	@contextlib.contextmanager
+	def span(self, name, /, **args):
+		"""Time the enclosed block. Exceptions are recorded in the span's args."""
+		if not self.enabled:
+			yield args
+			return
+		start = self._now_us()
+		try:
+			yield args
+		except BaseException as exc:
+			args['error'] = repr(exc)
+			raise
+		finally:
+			end = self._now_us()
+			with self._lock:
+				self._events.append((name, start, end - start, threading.get_ident(), args))
+
+	def begin(self):
+		"""Start stamp for a span that does not fit a ``with`` block; see :meth:`end`."""
+		return self._now_us()
+
+	def end(self, name, start, /, **args):
+		if self.enabled:
+			end = self._now_us()
+			with self._lock:
+				self._events.append((name, start, end - start, threading.get_ident(), args))
+
+	def event(self, name, /, **args):
+		"""Record an instant (zero-duration) event, e.g. an error."""
+		if self.enabled:
+			with self._lock:
+				self._events.append((name, self._now_us(), None, threading.get_ident(), args))
+
+	def count(self, name, n=1):
+		if self.enabled:
+			with self._lock:
+				self._counters[name] += n
+
+	def reset(self):
+		with self._lock:
+			self._events.clear()
+			self._counters.clear()
+
+	def counters(self):
+		with self._lock:
+			return dict(self._counters)
+
+	def summary(self):
+		"""Per-span statistics: count, total/mean/p95/max duration in ms."""
+		with self._lock:
+			events = list(self._events)
+		durations = collections.defaultdict(list)
+		for name, _start, dur, _tid, _args in events:
+			if dur is not None:
+				durations[name].append(dur / 1000)
+		out = {}
+		for name, values in durations.items():
+			values.sort()
+			out[name] = {
+				'count': len(values),
+				'total_ms': round(sum(values), 3),
+				'mean_ms': round(sum(values) / len(values), 3),
+				'p95_ms': round(values[min(len(values) - 1, int(len(values) * 0.95))], 3),
+				'max_ms': round(values[-1], 3),
+			}
+		return out
+
+	def chrome_trace(self):
+		with self._lock:
+			events = list(self._events)
+			counters = dict(self._counters)
+		pid = os.getpid()
+		trace = []
+		for name, start, dur, tid, args in events:
+			ev = {'name': name, 'cat': name.split('.')[0], 'ts': round(start, 1), 'pid': pid, 'tid': tid,
+				'args': {k: str(v) for k, v in args.items()}}
+			if dur is None:
+				ev.update(ph='i', s='t')
+			else:
+				ev.update(ph='X', dur=round(dur, 1))
+			trace.append(ev)
+		return {'traceEvents': trace, 'displayTimeUnit': 'ms', 'otherData': {'counters': counters}}
+
+	def export_chrome_trace(self, path):
+		with open(path, 'w', encoding='utf-8') as f:
+			json.dump(self.chrome_trace(), f)
+
+	def export_json(self, path):
+		with open(path, 'w', encoding='utf-8') as f:
+			json.dump({'spans': self.summary(), 'counters': self.counters()}, f, indent=2)
+
+	def format_table(self):
+		"""Plain-text summary for the stats panel."""
+		lines = [f"{'span':24s} {'count':>6s} {'mean ms':>9s} {'p95 ms':>9s} {'max ms':>9s}"]
+		for name, s in sorted(self.summary().items()):
+			lines.append(f"{name:24s} {s['count']:6d} {s['mean_ms']:9.2f} {s['p95_ms']:9.2f} {s['max_ms']:9.2f}")
+		counters = self.counters()
+		if counters:
+			lines.append('')
+			lines.append('counters')
+			for name, n in sorted(counters.items()):
+				lines.append(f'  {name:30s} {n:8d}')
+		return '\n'.join(lines)
+
+
+# process-wide recorder used by the data layer and the GUI
+METRICS = Metrics()
+span = METRICS.span
+begin = METRICS.begin
+end = METRICS.end
+event = METRICS.event
+count = METRICS.count
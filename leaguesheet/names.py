@@ -0,0 +1,9 @@
+"""Champion name normalization shared by autocomplete and name resolution."""
+
+import unicodedata
+
+
+def normalize_name(text):
+	"""Fold a name to lower-case alphanumerics: "Kai'Sa" -> "kaisa", "Dr. Mundo" -> "drmundo"."""
+	text = unicodedata.normalize('NFKD', text or '')
+	return ''.join(ch for ch in text.lower() if ch.isalnum())
@@ -0,0 +1,17 @@
+"""Filesystem locations shared by the app and its command-line tools."""
+
+import os
+
+
+def get_user_data_dir():
+	# Use a per-user writable data directory so packaged exes can update the cache.
+	if os.name == 'nt':
+		base = os.getenv('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+	else:
+		base = os.getenv('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
+	path = os.path.join(base, 'LeagueSheet')
+	try:
+		os.makedirs(path, exist_ok=True)
+	except Exception:
+		pass
+	return path
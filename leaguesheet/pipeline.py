@@ -0,0 +1,119 @@
+"""Small future-based dependency graph scheduler for lookups.
+
+A lookup is expressed as stages chained with :meth:`Scheduler.then` and fanned
+out with :meth:`Scheduler.when_all`. Stages only occupy a worker while they are
+actually running; waiting on a dependency never blocks a thread, so a bounded
+pool can run the graphs for every row at once without deadlocking.
+"""
+
+import concurrent.futures
+import threading
+
+
+def _settle(dst, method, value):
+	# the consumer may have cancelled ``dst`` in the meantime; then the
+	# outcome has nowhere to go
+	if dst.done():
+		return
+	try:
+		method(value)
+	except concurrent.futures.InvalidStateError:
+		pass
+
+
+def _cancel_upstream(dst, *srcs):
+	# a cancelled stage cancels the work it was waiting on (anything still
+	# queued never runs; a stage already running finishes on its own)
+	def on_done(d):
+		if d.cancelled():
+			for src in srcs:
+				src.cancel()
+	dst.add_done_callback(on_done)
+
+
+def _link(src, dst):
+	# Copy the outcome of ``src`` into ``dst``, flattening nested futures.
+	def on_done(f):
+		if f.cancelled():
+			dst.cancel()
+			return
+		exc = f.exception()
+		if exc is not None:
+			_settle(dst, dst.set_exception, exc)
+			return
+		res = f.result()
+		if isinstance(res, concurrent.futures.Future):
+			_link(res, dst)
+		else:
+			_settle(dst, dst.set_result, res)
+	_cancel_upstream(dst, src)
+	src.add_done_callback(on_done)
+
+
+def completed(value):
+	fut = concurrent.futures.Future()
+	fut.set_result(value)
+	return fut
+
+
+class Scheduler:
+	"""Runs task graphs on a bounded executor."""
+
+	def __init__(self, executor):
+		self.executor = executor
+
+	def submit(self, fn, *args):
+		out = concurrent.futures.Future()
+		try:
+			_link(self.executor.submit(fn, *args), out)
+		except RuntimeError as exc:
+			# executor shut down (window closing)
+			_settle(out, out.set_exception, exc)
+		return out
+
+	def then(self, fut, fn):
+		"""Run ``fn(result)`` once ``fut`` succeeds; failures propagate.
+
+		If ``fn`` returns a future, the returned future follows it.
+		"""
+		out = concurrent.futures.Future()
+
+		def on_done(f):
+			if f.cancelled():
+				out.cancel()
+				return
+			if out.done():
+				# cancelled while waiting: don't start the next stage at all
+				return
+			exc = f.exception()
+			if exc is not None:
+				_settle(out, out.set_exception, exc)
+				return
+			_link(self.submit(fn, f.result()), out)
+
+		_cancel_upstream(out, fut)
+		fut.add_done_callback(on_done)
+		return out
+
+	def when_all(self, futs):
+		"""Future resolving to ``futs`` once every one of them has finished."""
+		futs = list(futs)
+		out = concurrent.futures.Future()
+		if not futs:
+			out.set_result(futs)
+			return out
+		remaining = [len(futs)]
+		lock = threading.Lock()
+
+		def on_done(_f):
+			# done-callbacks can run on several worker threads at once
+			with lock:
+				remaining[0] -= 1
+				last = remaining[0] == 0
+			if last:
+				_settle(out, out.set_result, futs)
+
+		_cancel_upstream(out, *futs)
+		for f in futs:
+			f.add_done_callback(on_done)
+		return out
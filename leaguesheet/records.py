@@ -0,0 +1,184 @@
+"""Compact parsed champion records.
+
+A champion's Data Dragon JSON carries lore, skins, tips, stats and recommended
+items the app never reads. :class:`ChampionRecord` keeps only what lookups
+use, built once when the champion is fetched: ``__slots__`` objects, per-rank
+cooldowns as ``array('d')`` and interned names so the strings repeated across
+patches and rows are stored once.
+"""
+
+import sys
+from array import array
+
+
+def _intern(text):
+	return sys.intern(text) if text else text
+
+
+def format_number(value):
+	"""Render a cooldown the way Data Dragon's ``*Burn`` strings do (``8``, ``6.5``)."""
+	if value == int(value):
+		return str(int(value))
+	return f'{value:g}'
+
+
+class ImageRef:
+	"""An ``image`` block: file name plus sprite atlas tile (``sprite`` None when absent)."""
+
+	__slots__ = ('full', 'sprite', 'x', 'y', 'w', 'h')
+
+	def __init__(self, full, sprite=None, x=0, y=0, w=0, h=0):
+		self.full = full
+		self.sprite = sprite
+		self.x = x
+		self.y = y
+		self.w = w
+		self.h = h
+
+	@classmethod
+	def from_ddragon(cls, image):
+		image = image or {}
+		sprite = image.get('sprite')
+		if sprite and not all(k in image for k in ('x', 'y', 'w', 'h')):
+			sprite = None
+		return cls(_intern(image.get('full')), _intern(sprite),
+			image.get('x', 0), image.get('y', 0), image.get('w', 0), image.get('h', 0))
+
+	def to_ddragon(self):
+		out = {'full': self.full}
+		if self.sprite:
+			out.update(sprite=self.sprite, x=self.x, y=self.y, w=self.w, h=self.h)
+		return out
+
+
+def _numbers(values):
+	return array('d', (float(v) for v in values or ()))
+
+
+class SpellRecord:
+	"""One ability: per-rank cooldowns, tooltip text and the values its placeholders use.
+
+	``effect`` holds a per-rank array (or None) for each ``{{ eN }}``,
+	``effect_burn`` the matching ``"40/65/90"`` strings and ``vars`` the
+	``(key, link, coefficients)`` of scaling placeholders such as ``{{ a1 }}``.
+	"""
+
+	__slots__ = ('name', 'cooldown', 'tooltip', 'description', 'image', 'effect', 'effect_burn', 'vars')
+
+	def __init__(self, name, cooldown, tooltip, description, image, effect=(), effect_burn=(), vars=()):
+		self.name = name
+		self.cooldown = cooldown
+		self.tooltip = tooltip
+		self.description = description
+		self.image = image
+		self.effect = effect
+		self.effect_burn = effect_burn
+		self.vars = vars
+
+	@classmethod
+	def from_ddragon(cls, spell):
+		coeffs = []
+		for var in spell.get('vars') or ():
+			coeff = var.get('coeff')
+			coeff = coeff if isinstance(coeff, list) else [coeff] if coeff is not None else []
+			coeffs.append((_intern(var.get('key')), _intern(var.get('link')), _numbers(coeff)))
+		return cls(
+			_intern(spell.get('name')),
+			_numbers(spell.get('cooldown')),
+			spell.get('tooltip'),
+			spell.get('description'),
+			ImageRef.from_ddragon(spell.get('image')),
+			tuple(_numbers(e) if e else None for e in spell.get('effect') or ()),
+			tuple(_intern(b) for b in spell.get('effectBurn') or ()),
+			tuple(coeffs),
+		)
+
+	def to_ddragon(self):
+		"""The Data Dragon shaped dict :meth:`from_ddragon` reads back."""
+		return {
+			'name': self.name,
+			'cooldown': list(self.cooldown),
+			'tooltip': self.tooltip,
+			'description': self.description,
+			'image': self.image.to_ddragon(),
+			'effect': [list(e) if e is not None else None for e in self.effect],
+			'effectBurn': list(self.effect_burn),
+			'vars': [{'key': k, 'link': link, 'coeff': list(c)} for k, link, c in self.vars],
+		}
+
+	def with_text(self, text):
+		"""Same spell with ``text``'s name, tooltip and description (numbers and image shared)."""
+		return SpellRecord(
+			_intern(text.get('name')) or self.name, self.cooldown, text.get('tooltip'), text.get('description'),
+			self.image, self.effect, self.effect_burn, self.vars,
+		)
+
+	@property
+	def cooldown_burn(self):
+		"""Cooldowns per rank as ``"8/7/6"`` (a single value when every rank is equal)."""
+		if not self.cooldown:
+			return None
+		if all(c == self.cooldown[0] for c in self.cooldown):
+			return format_number(self.cooldown[0])
+		return '/'.join(format_number(c) for c in self.cooldown)
+
+
+def champion_text(info):
+	"""The localized strings of a Data Dragon champion dict, and nothing else."""
+	return {
+		'name': info.get('name'),
+		'title': info.get('title'),
+		'spells': [
+			{'name': s.get('name'), 'tooltip': s.get('tooltip'), 'description': s.get('description')}
+			for s in info.get('spells', ())
+		],
+	}
+
+
+class ChampionRecord:
+	"""The parts of a champion the app uses, parsed once at fetch time.
+
+	``locale`` is None for records parsed from the data locale; localized
+	copies made by :meth:`with_text` share its images and number arrays.
+	"""
+
+	__slots__ = ('key', 'name', 'title', 'image', 'spells', 'locale')
+
+	def __init__(self, key, name, title, image, spells, locale=None):
+		self.key = key
+		self.name = name
+		self.title = title
+		self.image = image
+		self.spells = spells
+		self.locale = locale
+
+	@classmethod
+	def from_ddragon(cls, info):
+		key = info.get('id')
+		return cls(
+			_intern(key),
+			_intern(info.get('name') or key),
+			info.get('title'),
+			ImageRef.from_ddragon(info.get('image')),
+			tuple(SpellRecord.from_ddragon(s) for s in info.get('spells', ())),
+		)
+
+	def to_ddragon(self):
+		"""The Data Dragon shaped dict :meth:`from_ddragon` reads back."""
+		return {
+			'id': self.key,
+			'name': self.name,
+			'title': self.title,
+			'image': self.image.to_ddragon(),
+			'spells': [s.to_ddragon() for s in self.spells],
+		}
+
+	def with_text(self, text, locale):
+		"""Copy carrying ``text`` (from :func:`champion_text`) for ``locale``."""
+		texts = text.get('spells') or ()
+		spells = tuple(s.with_text(texts[i]) if i < len(texts) else s for i, s in enumerate(self.spells))
+		return ChampionRecord(self.key, _intern(text.get('name')) or self.name, text.get('title'), self.image, spells, locale)
+
+	def spell(self, slot):
+		"""Spell at ``slot`` (0-3), or None when the champion has fewer."""
+		return self.spells[slot] if slot < len(self.spells) else None
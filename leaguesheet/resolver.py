@@ -0,0 +1,132 @@
+"""Champion name resolution shared by every lookup path.
+
+One :class:`ChampionResolver` is built per patch from ``champion.json``. It
+holds a sorted table of normalized aliases (id, display name, the words of
+multi-word names and common nicknames), so exact lookups and prefix lookups
+are a bisect. Ties break by alias priority, then alphabetically (the same
+order autocomplete lists them), so results never depend on dict order.
+"""
+
+import bisect
+import threading
+
+from .names import normalize_name
+
+
+# normalized nickname -> champion id
+NICKNAMES = {
+	'asol': 'AurelionSol',
+	'blitz': 'Blitzcrank',
+	'cait': 'Caitlyn',
+	'cass': 'Cassiopeia',
+	'cho': 'Chogath',
+	'ez': 'Ezreal',
+	'fiddle': 'Fiddlesticks',
+	'gp': 'Gangplank',
+	'heimer': 'Heimerdinger',
+	'j4': 'JarvanIV',
+	'kass': 'Kassadin',
+	'kat': 'Katarina',
+	'kog': 'KogMaw',
+	'lb': 'Leblanc',
+	'leesin': 'LeeSin',
+	'malph': 'Malphite',
+	'mf': 'MissFortune',
+	'morde': 'Mordekaiser',
+	'morg': 'Morgana',
+	'mundo': 'DrMundo',
+	'naut': 'Nautilus',
+	'nunu': 'Nunu',
+	'rek': 'RekSai',
+	'tf': 'TwistedFate',
+	'tk': 'TahmKench',
+	'trist': 'Tristana',
+	'trynd': 'Tryndamere',
+	'vlad': 'Vladimir',
+	'voli': 'Volibear',
+	'ww': 'Warwick',
+	'wukong': 'MonkeyKing',
+	'xin': 'XinZhao',
+	'yi': 'MasterYi',
+}
+
+# alias priorities, lower wins
+_ID, _NAME, _NICKNAME, _WORD = range(4)
+
+
+class ChampionResolver:
+	"""Maps free-form user input to a Data Dragon champion key."""
+
+	def __init__(self, champions):
+		"""``champions`` is an iterable of ``(key, id, display_name)``."""
+		table = {}
+		self._keys = []
+
+		def add(alias, priority, key):
+			if alias:
+				table.setdefault((alias, key), priority)
+				table[(alias, key)] = min(table[(alias, key)], priority)
+
+		by_id = {}
+		seen = set()
+		for key, cid, name in champions:
+			if key not in seen:
+				seen.add(key)
+				self._keys.append(key)
+			by_id[cid] = key
+			add(normalize_name(key), _ID, key)
+			add(normalize_name(cid), _ID, key)
+			add(normalize_name(name), _NAME, key)
+			words = (name or '').replace('&', ' ').replace('.', ' ').split()
+			if len(words) > 1:
+				for w in words:
+					add(normalize_name(w), _WORD, key)
+		for nick, cid in NICKNAMES.items():
+			if cid in by_id:
+				add(nick, _NICKNAME, by_id[cid])
+		self._table = sorted((alias, priority, key) for (alias, key), priority in table.items())
+		self._aliases = [row[0] for row in self._table]
+		self._memo = {}
+		self._lock = threading.Lock()
+
+	@classmethod
+	def from_ddragon(cls, data, localized=None):
+		"""Build from the ``data`` dict of Data Dragon's ``champion.json``.
+
+		``localized`` is the same dict in another locale; its display names
+		resolve too, alongside the ones from ``data``.
+		"""
+		champions = [(key, info.get('id', key), info.get('name', key)) for key, info in data.items()]
+		for key, info in (localized or {}).items():
+			if key in data and info.get('name'):
+				champions.append((key, info.get('id', key), info['name']))
+		return cls(champions)
+
+	def keys(self):
+		return list(self._keys)
+
+	def _best(self, lo, hi):
+		best = None
+		for alias, priority, key in self._table[lo:hi]:
+			if best is None or priority < best[0]:
+				best = (priority, key)
+		return best[1] if best else None
+
+	def resolve(self, text):
+		"""Return the champion key for ``text``, or None. Results are memoized."""
+		q = normalize_name(text)
+		if not q:
+			return None
+		with self._lock:
+			if q in self._memo:
+				return self._memo[q]
+		lo = bisect.bisect_left(self._aliases, q)
+		hi = bisect.bisect_right(self._aliases, q, lo)
+		key = self._best(lo, hi)
+		if key is None:
+			# no exact alias: first alias starting with the input
+			hi = bisect.bisect_left(self._aliases, q + '\uffff', lo)
+			key = self._best(lo, hi)
+		with self._lock:
+			self._memo[q] = key
+		return key
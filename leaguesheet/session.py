@@ -0,0 +1,67 @@
+"""Last-session snapshot for instant hot starts.
+
+On close the window saves what it was showing: row names, view mode, rank,
+language, row count, each row's resolved champion record and icon keys, and
+the Data Dragon version. On the next launch the sheet is repainted from the
+snapshot (records from the file, icons from the icon store) before anything
+touches the network; lookups only run again if the patch has moved on.
+"""
+
+import json
+import os
+
+from .ddcache import atomic_write_bytes
+from .records import ChampionRecord
+
+
+SESSION_FILE = 'session.json'
+# bumped when the layout changes; older snapshots are ignored
+SESSION_FORMAT = 1
+
+
+def session_path(data_dir):
+	return os.path.join(data_dir, SESSION_FILE)
+
+
+def row_state(name, shown=None, missing=False, icon_keys=()):
+	"""One row of a snapshot; ``shown`` is the ``(version, ChampionRecord)`` on screen."""
+	row = {'name': name}
+	if shown is not None:
+		version, record = shown
+		row['result'] = {
+			'version': version,
+			'locale': record.locale,
+			'record': record.to_ddragon(),
+			'icons': [list(key) for key in icon_keys],
+		}
+	elif missing:
+		row['missing'] = True
+	return row
+
+
+def row_result(row):
+	"""``(shown, icon_keys)`` back from a snapshot row (``(None, [])`` when empty)."""
+	result = row.get('result')
+	if not result:
+		return None, []
+	record = ChampionRecord.from_ddragon(result['record'])
+	record.locale = result.get('locale')
+	keys = [(v, name, size) for v, name, size in result.get('icons', ())]
+	return (result['version'], record), keys
+
+
+def save_session(path, state):
+	state = dict(state, format=SESSION_FORMAT)
+	atomic_write_bytes(path, json.dumps(state, separators=(',', ':')).encode('utf-8'))
+
+
+def load_session(path):
+	"""The saved snapshot, or None when there is none (or it can't be used)."""
+	try:
+		with open(path, encoding='utf-8') as f:
+			state = json.load(f)
+	except (OSError, ValueError):
+		return None
+	if not isinstance(state, dict) or state.get('format') != SESSION_FORMAT:
+		return None
+	return state
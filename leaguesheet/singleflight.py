@@ -0,0 +1,44 @@
+"""Single-flight call coalescing.
+
+When several threads ask for the same key at once (two rows with the same
+champion, a repeated Enter press, the startup updater racing a lookup), only
+the first runs the work; the others wait on its future and share the result.
+Nothing is cached once the call finishes - persistence is the caches' job.
+"""
+
+import concurrent.futures
+import threading
+
+from . import metrics
+
+
+class SingleFlight:
+	"""Deduplicates concurrent calls that share a key."""
+
+	def __init__(self, name='singleflight'):
+		self.name = name
+		self._lock = threading.Lock()
+		self._inflight = {}
+
+	def do(self, key, fn, *args, **kwargs):
+		"""Run ``fn(*args, **kwargs)`` unless a call for ``key`` is already running."""
+		with self._lock:
+			fut = self._inflight.get(key)
+			leader = fut is None
+			if leader:
+				fut = concurrent.futures.Future()
+				self._inflight[key] = fut
+		if not leader:
+			metrics.count(f'{self.name}.shared')
+			return fut.result()
+		try:
+			result = fn(*args, **kwargs)
+		except BaseException as exc:
+			fut.set_exception(exc)
+			raise
+		else:
+			fut.set_result(result)
+			return result
+		finally:
+			with self._lock:
+				self._inflight.pop(key, None)
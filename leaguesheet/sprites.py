@@ -0,0 +1,107 @@
+"""Sprite-atlas icon rendering.
+
+Data Dragon ships every champion portrait and spell icon packed into a few
+sprite sheets per patch (``img/sprite/champion0.png``, ``spell0.png``, ...) and
+each JSON ``image`` block carries the ``sprite`` name and ``x``/``y``/``w``/``h``
+of its tile. Sheets are downloaded once per patch, decoded once per process
+and icons are cropped out of them in memory, so a full sheet of lookups costs
+a handful of requests per patch instead of one per icon.
+"""
+
+import collections
+import io
+import os
+import shutil
+import threading
+
+from PIL import Image
+
+from . import metrics
+from .ddcache import atomic_write_bytes
+from .singleflight import SingleFlight
+
+
+def has_sprite(image):
+	return image is not None and bool(image.sprite)
+
+
+class SpriteSheets:
+	"""Sprite sheets on disk per patch, with the decoded images kept in memory."""
+
+	def __init__(self, root, max_decoded=16):
+		self.root = root
+		self.max_decoded = max_decoded
+		self._lock = threading.Lock()
+		self._decoded = collections.OrderedDict()
+		self._flights = SingleFlight('sprite.coalesced')
+
+	def _path(self, version, sprite):
+		return os.path.join(self.root, version, os.path.basename(sprite))
+
+	def available(self, version, sprite):
+		"""True when the sheet can be used without a download."""
+		with self._lock:
+			if (version, sprite) in self._decoded:
+				return True
+		return os.path.exists(self._path(version, sprite))
+
+	def store(self, version, sprite, raw):
+		atomic_write_bytes(self._path(version, sprite), raw)
+
+	def sheet(self, version, sprite, fetch=None):
+		"""Decoded RGBA sheet; ``fetch()`` returns the PNG bytes when it is not on disk."""
+		key = (version, sprite)
+		with self._lock:
+			im = self._decoded.get(key)
+			if im is not None:
+				self._decoded.move_to_end(key)
+				metrics.count('sprite_cache.hit')
+				return im
+		return self._flights.do(key, self._load, version, sprite, fetch)
+
+	def _load(self, version, sprite, fetch):
+		path = self._path(version, sprite)
+		try:
+			with open(path, 'rb') as f:
+				raw = f.read()
+		except OSError:
+			if fetch is None:
+				raise
+			metrics.count('sprite_cache.miss')
+			raw = fetch()
+			try:
+				self.store(version, sprite, raw)
+			except Exception:
+				pass
+		with metrics.span('sprite_decode', sprite=sprite):
+			im = Image.open(io.BytesIO(raw)).convert('RGBA')
+		with self._lock:
+			self._decoded[(version, sprite)] = im
+			while len(self._decoded) > self.max_decoded:
+				self._decoded.popitem(last=False)
+		return im
+
+	def render(self, version, image, size, fetch=None):
+		"""PNG bytes of the ``image`` tile, scaled to ``size`` x ``size``."""
+		im = self.sheet(version, image.sprite, fetch)
+		x, y, w, h = image.x, image.y, image.w, image.h
+		with metrics.span('sprite_crop', image=image.full, size=size):
+			tile = im.crop((x, y, x + w, y + h))
+			if (w, h) != (size, size):
+				tile = tile.resize((size, size), Image.LANCZOS)
+			out = io.BytesIO()
+			tile.save(out, format='PNG')
+			return out.getvalue()
+
+	def prune(self, keep_version):
+		"""Remove sheets of every patch other than ``keep_version``."""
+		try:
+			names = os.listdir(self.root)
+		except OSError:
+			return
+		for name in names:
+			if name != keep_version:
+				shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+		with self._lock:
+			for key in [k for k in self._decoded if k[0] != keep_version]:
+				del self._decoded[key]
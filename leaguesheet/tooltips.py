@@ -0,0 +1,159 @@
+"""Compiled, memoized spell tooltip rendering.
+
+Data Dragon tooltips are markup with ``{{ e1 }}``-style placeholders. Each
+distinct tooltip is parsed once into a template (literal text with the markup
+already mapped to plain text, plus placeholder names), and rendered output is
+cached per (version, champion, slot, rank), so switching the view mode or
+the rank re-renders nothing that has been shown before.
+
+Current patches mostly use named calculations (``{{ totaldamage }}``) whose
+values Data Dragon does not ship; a tooltip with any such placeholder left
+unresolved falls back to the spell's plain description.
+"""
+
+import collections
+import html
+import re
+import threading
+from functools import lru_cache
+
+from .records import format_number
+
+
+_PLACEHOLDER = re.compile(r'\{\{\s*([^{}\s]+)\s*\}\}')
+_TAG = re.compile(r'<\s*(/?)\s*([a-zA-Z][a-zA-Z0-9]*)[^>]*>')
+_SPACES = re.compile(r'[ \t]+')
+_NEWLINES = re.compile(r'\s*\n\s*')
+
+# markup with a plain-text meaning; every other tag is dropped
+_TAG_TEXT = {'br': '\n', 'li': '\n- ', 'p': '\n'}
+
+# ``vars`` links -> what the coefficient scales with
+_LINKS = {
+	'spelldamage': 'AP', '@dynamic.abilitypower': 'AP', 'abilitypower': 'AP',
+	'attackdamage': 'AD', '@dynamic.attackdamage': 'AD',
+	'bonusattackdamage': 'bonus AD', 'armor': 'armor', 'bonusarmor': 'bonus armor',
+	'spellblock': 'MR', 'bonusspellblock': 'bonus MR', 'bonushealth': 'bonus health', 'health': 'max health',
+}
+
+# placeholders the client fills from runes/items; empty on a plain tooltip
+_EMPTY = {'spellmodifierdescriptionappend': ''}
+
+
+def _tag_text(m):
+	closing, name = m.group(1), m.group(2).lower()
+	return '' if closing else _TAG_TEXT.get(name, '')
+
+
+def _plain_fragment(text):
+	# markup to plain text; edge spaces are kept so runs join up around values
+	text = _SPACES.sub(' ', html.unescape(_TAG.sub(_tag_text, text)))
+	return _NEWLINES.sub('\n', text)
+
+
+def _plain(text):
+	return _plain_fragment(text).strip()
+
+
+@lru_cache(maxsize=2048)
+def compile_tooltip(text):
+	"""Parse ``text`` into a tuple of literal strings and ``(placeholder,)`` tuples."""
+	parts = []
+	pos = 0
+	for m in _PLACEHOLDER.finditer(text or ''):
+		parts.append(text[pos:m.start()])
+		parts.append((m.group(1).lower(),))
+		pos = m.end()
+	parts.append((text or '')[pos:])
+	# map markup per literal run, so tags never swallow a placeholder
+	return tuple(p if isinstance(p, tuple) else _plain_fragment(p) for p in parts if p)
+
+
+def _at_rank(values, rank):
+	if rank is None or not values or rank > len(values):
+		return None
+	return format_number(values[rank - 1])
+
+
+def spell_values(spell, rank=None):
+	"""Placeholder name -> text for ``spell`` at ``rank`` (all ranks when None)."""
+	values = dict(_EMPTY, maxrank=str(len(spell.cooldown) or ''))
+	cooldown = _at_rank(spell.cooldown, rank) or spell.cooldown_burn
+	if cooldown:
+		values['cooldown'] = cooldown
+	for i, burn in enumerate(spell.effect_burn):
+		effect = spell.effect[i] if i < len(spell.effect) else None
+		text = _at_rank(effect, rank) or burn
+		if text:
+			values[f'e{i}'] = text
+	for key, link, coeff in spell.vars:
+		if not coeff:
+			continue
+		picked = coeff if rank is None else (coeff[min(rank, len(coeff)) - 1],)
+		scale = _LINKS.get((link or '').lower())
+		if scale:
+			text = '/'.join(f'{format_number(round(c * 100, 1))}%' for c in picked) + f' {scale}'
+		else:
+			text = '/'.join(format_number(c) for c in picked)
+		values[key.lower()] = text
+	return values
+
+
+def render_template(template, values):
+	"""Fill ``template`` from ``values``; None if any placeholder has no value."""
+	out = []
+	for part in template:
+		if isinstance(part, tuple):
+			text = values.get(part[0])
+			if text is None:
+				return None
+			out.append(text)
+		else:
+			out.append(part)
+	return _NEWLINES.sub('\n', ''.join(out)).strip()
+
+
+class TooltipRenderer:
+	"""Rendered tooltips cached per (version, champion, slot, rank, locale)."""
+
+	def __init__(self, maxsize=4096):
+		self.maxsize = maxsize
+		self._lock = threading.Lock()
+		self._cache = collections.OrderedDict()
+
+	def render(self, version, champ_key, slot, spell, rank=None, locale=None):
+		key = (version, champ_key, slot, rank, locale)
+		with self._lock:
+			text = self._cache.get(key)
+			if text is not None:
+				self._cache.move_to_end(key)
+				return text
+		text = None
+		if spell.tooltip:
+			text = render_template(compile_tooltip(spell.tooltip), spell_values(spell, rank))
+		if text is None:
+			text = _plain(spell.description or '')
+		with self._lock:
+			self._cache[key] = text
+			while len(self._cache) > self.maxsize:
+				self._cache.popitem(last=False)
+		return text
+
+	def clear(self):
+		with self._lock:
+			self._cache.clear()
+
+
+TOOLTIPS = TooltipRenderer()
+
+
+def spell_text(version, record, slot, mode='Cooldown', rank=None):
+	"""Cell text for ``record``'s spell at ``slot``: cooldowns or the rendered tooltip."""
+	spell = record.spell(slot)
+	if spell is None:
+		return '-'
+	if mode == 'Cooldown':
+		if rank is not None:
+			return _at_rank(spell.cooldown, rank) or '-'
+		return spell.cooldown_burn or '-'
+	return TOOLTIPS.render(version, record.key, slot, spell, rank, record.locale) or '-'